@@ -1,4 +1,4 @@
-from manim import *
+from manim import BLUE, WHITE, NumberPlane, Scene, Text, Triangle, config
 
 config.background_color = WHITE
 config.frame_width = 16
@@ -1,4 +1,6 @@
 import math
+import sys
+from pathlib import Path
 from typing import Tuple
 
 import numpy as np
@@ -6,6 +8,15 @@ from manim import *
 from manim import VGroup, Arrow
 from manim.typing import Vector3
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.numeric_matrix import NumericMatrix, SetValues
+from common.tex_cache import tex_cache
+from common.text_cache import text_cache
+
+tex_cache.install()
+text_cache.install()
+
 
 class Word2Vec(Scene):
     def construct(self):
@@ -805,6 +816,7 @@ class DecoderOnly(ThreeDScene):
         self.wait()
         self.play(FadeOut(commentary1))
 
+        self.next_section("embedding")
         self.embedding()
         self.wait()
 
@@ -828,6 +840,7 @@ class DecoderOnly(ThreeDScene):
         self.wait()
         self.play(FadeOut(commentary1))
 
+        self.next_section("get_qkv")
         self.get_qkv()
         self.wait()
 
@@ -847,6 +860,7 @@ class DecoderOnly(ThreeDScene):
         self.wait()
         self.play(FadeOut(commentary1))
 
+        self.next_section("multi_head")
         self.multi_head()
         self.play(zoom.animate.set_value(0.6))
         self.wait()
@@ -884,6 +898,7 @@ class DecoderOnly(ThreeDScene):
         self.wait(0.8)
         self.play(FadeOut(commentary1))
 
+        self.next_section("self_attention")
         self.self_attention()
         self.wait()
 
@@ -948,7 +963,7 @@ class DecoderOnly(ThreeDScene):
             values = np.random.random((6, 1)).round(2)
             sum_vector[:, i] += values[:, 0]
 
-            vector = Matrix(values, bracket_v_buff=SMALL_BUFF).scale(0.7).move_to(
+            vector = NumericMatrix(values, bracket_v_buff=SMALL_BUFF).scale(0.7).move_to(
                 embedding_prism.get_center()).rotate(PI / 2, axis=RIGHT)
 
             np.random.seed(i + 10)
@@ -961,7 +976,7 @@ class DecoderOnly(ThreeDScene):
             self.play(
                 Transform(
                     position_vector,
-                    Matrix(position_values, bracket_v_buff=SMALL_BUFF).scale(0.7).move_to(
+                    NumericMatrix(position_values, bracket_v_buff=SMALL_BUFF).scale(0.7).move_to(
                         embedding_prism.get_center() + LEFT * 3 + OUT * 4 + RIGHT * i * 1.5 + DOWN * 3
                     ).rotate(PI / 2, axis=RIGHT).fade(0),
                     run_time=1.5
@@ -978,7 +993,7 @@ class DecoderOnly(ThreeDScene):
 
         self.play(self.all.animate.shift(UP * 4))
         sum_vector = sum_vector.round(2)
-        self.x_matrix = Matrix(sum_vector).set_color(PURPLE_A).move_to(ORIGIN).scale(0.7).rotate(PI / 2, axis=RIGHT)
+        self.x_matrix = NumericMatrix(sum_vector).set_color(PURPLE_A).move_to(ORIGIN).scale(0.7).rotate(PI / 2, axis=RIGHT)
 
         self.play(Succession(
             Transform(
@@ -1041,7 +1056,7 @@ class DecoderOnly(ThreeDScene):
 
         np.random.seed(114)
         value = np.random.random((6, 5)).round(2)
-        new_q = Matrix(
+        new_q = NumericMatrix(
             value,
             v_buff=0.6,
             h_buff=1.2,
@@ -1051,7 +1066,7 @@ class DecoderOnly(ThreeDScene):
 
         np.random.seed(514)
         value = np.random.random((6, 5)).round(2)
-        new_k = Matrix(
+        new_k = NumericMatrix(
             value,
             v_buff=0.6,
             h_buff=1.2,
@@ -1061,7 +1076,7 @@ class DecoderOnly(ThreeDScene):
 
         np.random.seed(1919)
         value = np.random.random((6, 5)).round(2)
-        new_v = Matrix(
+        new_v = NumericMatrix(
             value,
             v_buff=0.6,
             h_buff=1.2,
@@ -1125,7 +1140,7 @@ class DecoderOnly(ThreeDScene):
 
         np.random.seed(111)
         value = np.random.random((6, 5)).round(2)
-        q_1_new = Matrix(
+        q_1_new = NumericMatrix(
             value,
             v_buff=0.6,
             h_buff=1.2,
@@ -1137,7 +1152,7 @@ class DecoderOnly(ThreeDScene):
 
         np.random.seed(112)
         value = np.random.random((6, 5)).round(2)
-        q_2_new = Matrix(
+        q_2_new = NumericMatrix(
             value,
             v_buff=0.6,
             h_buff=1.2,
@@ -1149,7 +1164,7 @@ class DecoderOnly(ThreeDScene):
 
         np.random.seed(113)
         value = np.random.random((6, 5)).round(2)
-        q_3_new = Matrix(
+        q_3_new = NumericMatrix(
             value,
             v_buff=0.6,
             h_buff=1.2,
@@ -1179,7 +1194,7 @@ class DecoderOnly(ThreeDScene):
 
         np.random.seed(121)
         value = np.random.random((6, 5)).round(2)
-        k_1_new = Matrix(
+        k_1_new = NumericMatrix(
             value,
             v_buff=0.6,
             h_buff=1.2,
@@ -1191,7 +1206,7 @@ class DecoderOnly(ThreeDScene):
 
         np.random.seed(122)
         value = np.random.random((6, 5)).round(2)
-        k_2_new = Matrix(
+        k_2_new = NumericMatrix(
             value,
             v_buff=0.6,
             h_buff=1.2,
@@ -1203,7 +1218,7 @@ class DecoderOnly(ThreeDScene):
 
         np.random.seed(123)
         value = np.random.random((6, 5)).round(2)
-        k_3_new = Matrix(
+        k_3_new = NumericMatrix(
             value,
             v_buff=0.6,
             h_buff=1.2,
@@ -1233,7 +1248,7 @@ class DecoderOnly(ThreeDScene):
 
         np.random.seed(131)
         value = np.random.random((6, 5)).round(2)
-        v_1_new = Matrix(
+        v_1_new = NumericMatrix(
             value,
             v_buff=0.6,
             h_buff=1.2,
@@ -1245,7 +1260,7 @@ class DecoderOnly(ThreeDScene):
 
         np.random.seed(132)
         value = np.random.random((6, 5)).round(2)
-        v_2_new = Matrix(
+        v_2_new = NumericMatrix(
             value,
             v_buff=0.6,
             h_buff=1.2,
@@ -1257,7 +1272,7 @@ class DecoderOnly(ThreeDScene):
 
         np.random.seed(133)
         value = np.random.random((6, 5)).round(2)
-        v_3_new = Matrix(
+        v_3_new = NumericMatrix(
             value,
             v_buff=0.6,
             h_buff=1.2,
@@ -1280,15 +1295,15 @@ class DecoderOnly(ThreeDScene):
 
     def self_attention(self):
         def update_matrix(values: List[np.ndarray], shift: List[Vector3]) -> Tuple[Matrix, Matrix, Matrix]:
-            _a_1_new = Matrix(
+            _a_1_new = NumericMatrix(
                 values[0],
             ).rotate(PI / 2, axis=IN).rotate(PI / 2, axis=DOWN).set_color(WHITE).move_to(a_1).shift(shift[0])
 
-            _a_2_new = Matrix(
+            _a_2_new = NumericMatrix(
                 values[1],
             ).rotate(PI / 2, axis=IN).rotate(PI / 2, axis=DOWN).set_color(WHITE).move_to(a_2).shift(shift[1])
 
-            _a_3_new = Matrix(
+            _a_3_new = NumericMatrix(
                 values[2],
             ).rotate(PI / 2, axis=IN).rotate(PI / 2, axis=DOWN).set_color(WHITE).move_to(a_3).shift(shift[2])
 
@@ -1300,7 +1315,7 @@ class DecoderOnly(ThreeDScene):
         k_1 = np.random.random((6, 5))
         a_1_value: np.ndarray = np.matmul(q_1, k_1.T).round(2)
 
-        a_1 = Matrix(
+        a_1 = NumericMatrix(
             a_1_value,
             v_buff=0.8,
             h_buff=1.2,
@@ -1316,7 +1331,7 @@ class DecoderOnly(ThreeDScene):
         k_2 = np.random.random((6, 5))
         a_2_value: np.ndarray = np.matmul(q_2, k_2.T).round(2)
 
-        a_2 = Matrix(
+        a_2 = NumericMatrix(
             a_2_value,
             v_buff=0.8,
             h_buff=1.2,
@@ -1332,7 +1347,7 @@ class DecoderOnly(ThreeDScene):
         k_3 = np.random.random((6, 5))
         a_3_value: np.ndarray = np.matmul(q_3, k_3.T).round(2)
 
-        a_3 = Matrix(
+        a_3 = NumericMatrix(
             a_3_value,
             v_buff=0.8,
             h_buff=1.2,
@@ -1384,12 +1399,11 @@ class DecoderOnly(ThreeDScene):
         a_1_value = (a_1_value / math.sqrt(6)).round(2)
         a_2_value = (a_2_value / math.sqrt(6)).round(2)
         a_3_value = (a_3_value / math.sqrt(6)).round(2)
-        a_1_new, a_2_new, a_3_new = update_matrix([a_1_value, a_2_value, a_3_value], [DOWN * 4, DOWN * 4, DOWN * 4])
 
         self.play(
-            Transform(a_1, a_1_new.scale(0.7)),
-            Transform(a_2, a_2_new.fade(0.5).scale(0.7)),
-            Transform(a_3, a_3_new.fade(0.6).scale(0.7)),
+            SetValues(a_1, a_1_value, shift=DOWN * 4),
+            SetValues(a_2, a_2_value, shift=DOWN * 4),
+            SetValues(a_3, a_3_value, shift=DOWN * 4),
             self.scale_block.animate.shift(UP * 4)
         )
         a_group = VGroup(a_1, a_2, a_3)
@@ -1397,7 +1411,7 @@ class DecoderOnly(ThreeDScene):
 
         mask = np.zeros((6, 6))
         mask[np.triu_indices(6, 1)] = np.NINF
-        mask_matrix = Matrix(
+        mask_matrix = NumericMatrix(
             mask
         ).rotate(PI / 2, axis=IN).rotate(PI / 2, axis=DOWN).set_color(WHITE)
 
@@ -1437,20 +1451,18 @@ class DecoderOnly(ThreeDScene):
         a_2_value = a_2_value + mask
         a_3_value = a_3_value + mask
 
-        a_1_new, a_2_new, a_3_new = update_matrix([a_1_value, a_2_value, a_3_value], [ORIGIN, ORIGIN, ORIGIN])
-
         self.play(
             Succession(
                 mask_matrix.copy().animate.move_to(a_1).fade(1),
-                Transform(a_1, a_1_new.scale(0.7)),
+                SetValues(a_1, a_1_value),
             ),
             Succession(
                 mask_matrix.copy().animate.move_to(a_2).fade(1),
-                Transform(a_2, a_2_new.scale(0.7)),
+                SetValues(a_2, a_2_value),
             ),
             Succession(
                 mask_matrix.animate.move_to(a_3).fade(1),
-                Transform(a_3, a_3_new.scale(0.7)),
+                SetValues(a_3, a_3_value),
             ),
         )
 
@@ -1491,12 +1503,11 @@ class DecoderOnly(ThreeDScene):
         a_1_value = sigmoid(a_1_value)
         a_2_value = sigmoid(a_2_value)
         a_3_value = sigmoid(a_3_value)
-        a_1_new, a_2_new, a_3_new = update_matrix([a_1_value, a_2_value, a_3_value], [DOWN * 3, DOWN * 3, DOWN * 3])
 
         self.play(
-            Transform(a_1, a_1_new.scale(0.7)),
-            Transform(a_2, a_2_new.fade(0.5).scale(0.7)),
-            Transform(a_3, a_3_new.fade(0.6).scale(0.7)),
+            SetValues(a_1, a_1_value, shift=DOWN * 3),
+            SetValues(a_2, a_2_value, shift=DOWN * 3),
+            SetValues(a_3, a_3_value, shift=DOWN * 3),
             self.sigmoid_block.animate.shift(UP * 5.5)
         )
 
@@ -1569,7 +1580,7 @@ class DecoderOnly(ThreeDScene):
         self.play(FadeOut(commentary1))
 
         a_out = np.concatenate((a_1_value, a_2_value, a_3_value), axis=0)
-        a_out_matrix = Matrix(
+        a_out_matrix = NumericMatrix(
             a_out,
         ).rotate(PI / 2, axis=IN).rotate(PI / 2, axis=DOWN).set_color(WHITE)
 
@@ -1605,7 +1616,7 @@ class DecoderOnly(ThreeDScene):
         self.play(self.all.animate.shift(UP * 2))
 
         y_value = np.random.random((6, 5)).round(2)
-        self.y_matrix = Matrix(
+        self.y_matrix = NumericMatrix(
             y_value,
         ).set_color(PURPLE_A).move_to(self.liner2).rotate(PI / 2, axis=RIGHT)
 
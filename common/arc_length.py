@@ -0,0 +1,172 @@
+"""Cached arc-length lookups for ``VMobject.point_from_proportion``.
+
+``point_from_proportion`` samples every Bézier curve of the path to measure
+its length on each call, so ``MoveAlongPath`` and updaters pay for the whole
+path on every frame. The lengths are measured once, vectorized, and kept on
+the mobject as cumulative sums; a call then binary-searches them and
+evaluates a single curve. The lengths are measured with the same samples as
+manim, so points come out the same.
+
+The sums hold on to the points array they were measured on, so a mobject
+given a new array measures again. The manim methods that edit the array in
+place (``shift``, ``apply_points_function``, ``interpolate``, ...) drop the
+sums of the mobjects they edit; code writing into ``mob.points`` itself has
+to go through ``set_points``.
+
+Arcs and circles skip the table: their point is computed from the centre,
+radius and sweep read off the current points.
+
+    from common.arc_length import arc_length_cache
+    arc_length_cache.install()
+"""
+from __future__ import annotations
+
+import atexit
+from functools import wraps
+from math import comb
+from typing import NamedTuple
+
+import numpy as np
+from manim import Arc, Mobject, VMobject, logger
+
+
+# methods that edit the points in place, and whether they do so for the whole family
+IN_PLACE_EDITS = {
+    Mobject: {"shift": True, "apply_points_function_about_point": True, "wag": True},
+    VMobject: {"set_anchors_and_handles": False},
+}
+
+
+class ArcLengthIndex(NamedTuple):
+    # the array measured, kept so that its id is not reused
+    points: np.ndarray
+    # cumulative length at the end of every curve
+    ends: np.ndarray
+
+    @property
+    def total(self) -> float:
+        return float(self.ends[-1])
+
+
+def bernstein(degree: int, t: np.ndarray) -> np.ndarray:
+    t = np.asarray(t, dtype=float)[..., None]
+    i = np.arange(degree + 1)
+    return np.array([comb(degree, k) for k in i]) * (1 - t) ** (degree - i) * t ** i
+
+
+class ArcLengthCache:
+    def __init__(self, sample_points: int = 10):
+        # manim measures every curve as a polyline through this many points
+        self.sample_points = sample_points
+        self.hits = 0
+        self.misses = 0
+        self._installed = False
+
+    def index(self, mob: VMobject) -> ArcLengthIndex:
+        index = mob.__dict__.get("_arc_length_index")
+        if index is not None and index.points is mob.points:
+            self.hits += 1
+            return index
+
+        self.misses += 1
+        n = mob.n_points_per_curve
+        curves = mob.points[:len(mob.points) // n * n].reshape(-1, n, 3)
+        samples = np.einsum("sk,ckd->csd", bernstein(n - 1, np.linspace(0, 1, self.sample_points)), curves)
+        lengths = np.linalg.norm(np.diff(samples, axis=1), axis=2).sum(axis=1)
+
+        index = ArcLengthIndex(mob.points, np.cumsum(lengths))
+        mob.__dict__["_arc_length_index"] = index
+        return index
+
+    @staticmethod
+    def arc_point(mob: Arc, alpha: float) -> np.ndarray | None:
+        """The point at ``alpha`` of the arc, or ``None`` if the points are no longer an arc."""
+        points = mob.points
+        center = mob.get_arc_center()
+        radial = points[0] - center
+        radius = np.linalg.norm(radial)
+        if radius == 0:
+            return None
+        tangent = points[1] - points[0]
+        tangent = tangent - np.dot(tangent, radial) / radius ** 2 * radial
+        if not np.any(tangent):
+            return None
+
+        u, v = radial / radius, tangent / np.linalg.norm(tangent)
+        sweep = abs(mob.angle)
+
+        def at(theta):
+            return center + radius * (np.cos(theta) * u + np.sin(theta) * v)
+
+        # the anchors are evenly spaced, a stretched or otherwise reshaped arc
+        # has to go through the curves
+        n = mob.n_points_per_curve
+        curves = len(points) // n
+        middle = curves // 2
+        for anchor, theta in ((points[middle * n], middle / curves * sweep), (points[-1], sweep)):
+            if np.linalg.norm(at(theta) - anchor) > 1e-6 * radius:
+                return None
+        return at(alpha * sweep)
+
+    def point_from_proportion(self, mob: VMobject, alpha: float) -> np.ndarray:
+        if alpha < 0 or alpha > 1:
+            raise ValueError(f"Alpha {alpha} not between 0 and 1.")
+        mob.throw_error_if_no_points()
+        if alpha == 1:
+            return mob.points[-1]
+
+        if isinstance(mob, Arc):
+            point = self.arc_point(mob, alpha)
+            if point is not None:
+                return point
+
+        index = self.index(mob)
+        target = alpha * index.total
+        i = min(int(np.searchsorted(index.ends, target)), len(index.ends) - 1)
+        start = index.ends[i - 1] if i else 0.0
+        length = index.ends[i] - start
+        residue = (target - start) / length if length != 0 else 0
+
+        n = mob.n_points_per_curve
+        return bernstein(n - 1, residue) @ mob.points[i * n:(i + 1) * n]
+
+    def install(self) -> None:
+        if self._installed:
+            return
+        self._installed = True
+
+        vmobject_classes = [VMobject]
+        in_place_edits = dict(IN_PLACE_EDITS)
+        try:
+            from manim.mobject.opengl.opengl_mobject import OpenGLMobject
+            from manim.mobject.opengl.opengl_vectorized_mobject import OpenGLVMobject
+            vmobject_classes.append(OpenGLVMobject)
+            in_place_edits[OpenGLMobject] = {"set_points": False, "interpolate": False, "apply_points_function": True}
+        except ImportError:
+            pass
+
+        for cls in vmobject_classes:
+            cls.point_from_proportion = lambda mob, alpha: self.point_from_proportion(mob, alpha)
+        for cls, methods in in_place_edits.items():
+            for name, family in methods.items():
+                setattr(cls, name, self.invalidating(getattr(cls, name), family))
+        atexit.register(self.report)
+
+    @staticmethod
+    def invalidating(method, family: bool):
+        @wraps(method)
+        def edit(mob, *args, **kwargs):
+            result = method(mob, *args, **kwargs)
+            for edited in mob.get_family() if family else (mob,):
+                edited.__dict__.pop("_arc_length_index", None)
+            return result
+
+        return edit
+
+    def report(self) -> None:
+        total = self.hits + self.misses
+        if total:
+            logger.info(f"Arc length cache: {self.hits} hits, {self.misses} misses ({self.hits / total:.0%})")
+
+
+arc_length_cache = ArcLengthCache()
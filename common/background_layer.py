@@ -0,0 +1,120 @@
+"""Keep the rasterized static layer of the cairo renderer across animations.
+
+For every ``play`` and ``wait``, manim rasterizes the mobjects below the
+first moving one (a ``NumberPlane`` or ``Axes`` added first, typically) into
+a static image, then draws only the moving mobjects on top of it for every
+frame. The static image is thrown away after the animation, and rasterized
+again for the next one even when nothing in it changed.
+
+Once installed, static images are kept, keyed by a signature of everything
+that is drawn in them: the points and style arrays of the static mobjects
+and the camera's frame. An animation whose static mobjects are unchanged
+reuses the image; moving, restyling or adding a background mobject changes
+the signature and rasterizes it again.
+
+    from common.background_layer import background_layer
+    background_layer.install()
+
+The OpenGL renderer draws every mobject every frame and has no static
+image; under it, which ``manim.cfg`` selects for Python entry points,
+``install`` warns and leaves manim as it is.
+"""
+from __future__ import annotations
+
+import atexit
+import hashlib
+from collections import OrderedDict
+from typing import Iterable
+
+import numpy as np
+from manim import Mobject, RendererType, config, logger
+from manim.renderer.cairo_renderer import CairoRenderer
+
+# everything the cairo camera reads when it draws a mobject
+DRAWN_ATTRIBUTES = (
+    "points", "fill_rgbas", "stroke_rgbas", "stroke_width", "background_stroke_rgbas", "background_stroke_width",
+    "sheen_factor", "sheen_direction", "joint_type", "cap_style", "pixel_array", "z_index", "shade_in_3d",
+)
+CAMERA_ATTRIBUTES = ("frame_center", "frame_width", "frame_height", "background_color", "background_opacity")
+
+
+def _update(digest, value) -> None:
+    if isinstance(value, Mobject):
+        value = value.get_center()
+    array = np.asarray(value)
+    # colours and enums are hashed by what they print as
+    digest.update(str(value).encode() if array.dtype == object else array.tobytes())
+
+
+def digest_mobject(digest, mob: Mobject) -> None:
+    """Feed ``digest`` with everything the cairo camera reads to draw ``mob``, but not its submobjects."""
+    digest.update(f"{type(mob).__name__}:{id(mob)}".encode())
+    for name in DRAWN_ATTRIBUTES:
+        _update(digest, mob.__dict__.get(name))
+
+
+def digest_camera(digest, camera) -> None:
+    for name in CAMERA_ATTRIBUTES:
+        _update(digest, getattr(camera, name, None))
+    # ThreeDCamera keeps its angles in value trackers
+    if hasattr(camera, "get_value_trackers"):
+        for tracker in camera.get_value_trackers():
+            _update(digest, tracker.get_value())
+
+
+class BackgroundLayer:
+    def __init__(self, max_images: int = 4):
+        # every image is a full frame, 8 MB at 1080p
+        self.max_images = max_images
+        self.hits = 0
+        self.misses = 0
+        self._images: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self._installed = False
+
+    @staticmethod
+    def signature(camera, mobjects: Iterable[Mobject]) -> bytes:
+        digest = hashlib.blake2b(digest_size=16)
+        digest_camera(digest, camera)
+        for mob in mobjects:
+            digest_mobject(digest, mob)
+        return digest.digest()
+
+    def install(self) -> None:
+        if self._installed:
+            return
+        if config.renderer != RendererType.CAIRO:
+            logger.warning(f"The background layer only applies to cairo, not installed for {config.renderer.value}")
+            return
+        self._installed = True
+
+        save_static_frame_data = CairoRenderer.save_static_frame_data
+
+        def cached_save_static_frame_data(renderer: CairoRenderer, scene, static_mobjects):
+            if not static_mobjects:
+                return save_static_frame_data(renderer, scene, static_mobjects)
+
+            key = self.signature(renderer.camera, static_mobjects)
+            if key in self._images:
+                self._images.move_to_end(key)
+                self.hits += 1
+                # set_frame_to_background copies it into the camera, the cached image stays untouched
+                renderer.static_image = self._images[key]
+                return renderer.static_image
+
+            self.misses += 1
+            image = save_static_frame_data(renderer, scene, static_mobjects)
+            self._images[key] = image
+            if len(self._images) > self.max_images:
+                self._images.popitem(last=False)
+            return image
+
+        CairoRenderer.save_static_frame_data = cached_save_static_frame_data
+        atexit.register(self.report)
+
+    def report(self) -> None:
+        total = self.hits + self.misses
+        if total:
+            logger.info(f"Background layer: {self.hits} of {total} static images reused")
+
+
+background_layer = BackgroundLayer()
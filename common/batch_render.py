@@ -0,0 +1,118 @@
+"""Render every scene of one or more files on a pool of worker processes.
+
+``manim.cfg`` renders one scene per run, and ``-a`` renders the scenes of a
+file one after the other in a single process. Here every scene of the
+selected files is a job for a pool of workers. The jobs are sent out longest
+first, using the times of the previous batch, so a long scene does not start
+last and leave the other workers idle; scenes without a previous time go
+first.
+
+Workers render several scenes each. A scene file is run once per worker,
+and ``common.tex_cache`` is shared by all of them on disk, its index kept
+consistent with a file lock. The run ends with the time of every scene and
+how much the pool saved over rendering them one after the other.
+
+    python -m common.batch_render "demo/*.py" -q l -j 4
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+from typing import Dict, List, Tuple
+
+from manim import logger
+
+from common.benchmark import SCENE_FILES, discover
+from common.render import ROOT, render_scene
+from common.tex_cache import tex_cache
+
+TIMINGS_PATH = ROOT / "media" / "batch_timings.json"
+
+
+def render_job(file: str, scene_name: str, quality: str | None, renderer: str | None) -> dict:
+    # also for the scene files that do not install it themselves
+    tex_cache.install()
+    hits, misses = tex_cache.hits, tex_cache.misses
+    start = time.perf_counter()
+    movie = render_scene(ROOT / file, scene_name, quality, renderer, preview=False)
+    return {
+        "seconds": time.perf_counter() - start,
+        "movie": str(movie) if movie else None,
+        "worker": os.getpid(),
+        "tex_hits": tex_cache.hits - hits,
+        "tex_misses": tex_cache.misses - misses,
+    }
+
+
+def schedule(scenes: List[Tuple[str, str]], timings: Dict[str, float]) -> List[Tuple[str, str]]:
+    """Longest expected first, scenes never timed before them all."""
+    return sorted(scenes, key=lambda scene: -timings.get("::".join(scene), float("inf")))
+
+
+def run(
+        scenes: List[Tuple[str, str]],
+        quality: str | None = None,
+        renderer: str | None = None,
+        jobs: int | None = None
+) -> Dict[str, dict]:
+    timings = json.loads(TIMINGS_PATH.read_text(encoding="utf-8")) if TIMINGS_PATH.exists() else {}
+    results = {}
+    # spawned workers, a forked OpenGL context or ffmpeg pipe is not usable
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count(), mp_context=get_context("spawn")) as pool:
+        futures = {
+            pool.submit(render_job, file, scene_name, quality, renderer): f"{file}::{scene_name}"
+            for file, scene_name in schedule(scenes, timings)
+        }
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                logger.error(f"{key} failed: {e!r}")
+                results[key] = {"error": repr(e)}
+                continue
+            timings[key] = results[key]["seconds"]
+            logger.info(f"{key}: {results[key]['seconds']:.2f}s on worker {results[key]['worker']}")
+
+    TIMINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    TIMINGS_PATH.write_text(json.dumps(timings, indent=2), encoding="utf-8")
+    return results
+
+
+def report(results: Dict[str, dict], wall: float) -> None:
+    done = {key: result for key, result in results.items() if "error" not in result}
+    serial = sum(result["seconds"] for result in done.values())
+    lines = [
+        f"{result['seconds']:8.2f}s  {key}"
+        for key, result in sorted(done.items(), key=lambda item: -item[1]["seconds"])
+    ]
+    lines += [f"  failed  {key}" for key in results if key not in done]
+    hits = sum(result["tex_hits"] for result in done.values())
+    misses = sum(result["tex_misses"] for result in done.values())
+    logger.info(
+        "Batch render:\n" + "\n".join(lines) + "\n"
+        f"{len(done)} of {len(results)} scenes in {wall:.2f}s, {serial:.2f}s one after the other "
+        f"({serial / wall if wall else 0:.1f}x) on {len({result['worker'] for result in done.values()})} workers, "
+        f"Tex cache {hits} hits, {misses} misses"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", default=SCENE_FILES, help="glob patterns relative to the repo root")
+    parser.add_argument("-q", "--quality", default=None, help="l, m, h, p or k")
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    parser.add_argument("--renderer", default=None)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = run(discover(args.files), args.quality, args.renderer, args.jobs)
+    report(results, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""Render every scene of the repo and record how long it takes.
+
+Each scene is rendered in a fresh process, with manim's partial movie cache
+disabled, and reports:
+
+* ``total``: wall time of ``Scene.render``
+* ``construct``: the part of it spent in ``construct`` outside ``play``/``wait``
+* ``animations``: wall time and frame count of every ``play``/``wait`` call
+* ``fps``: frames rendered per second of ``play``/``wait``
+* ``peak_rss_mib``: peak resident memory of the rendering process
+* ``tex_compiles`` and ``text_layouts``: LaTeX runs and Pango layouts
+* ``writer``: how long the renderer and the encoder waited for each other,
+  when the movie is encoded (see ``common.frame_writer``)
+
+Results go to a JSON file, which can serve as the baseline of a later run:
+
+    python -m common.benchmark -q l -o benchmark.json
+    python -m common.benchmark -q l --compare benchmark.json
+"""
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from manim import MarkupText, Scene, Text, logger
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils import tex_file_writing
+
+from common.frame_writer import frame_writer
+from common.render import ROOT, load_scenes, render_scene
+from common.static_frames import static_frames
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+SCENE_FILES = ["03Animations.py", "04Position.py", "06Animation2.py", "demo/*.py", "LLM/*.py"]
+
+
+def discover(patterns: List[str] = SCENE_FILES) -> List[Tuple[str, str]]:
+    """``(file, scene)`` of every ``Scene`` subclass defined in the files matching ``patterns``."""
+    scenes = []
+    for pattern in patterns:
+        for file in sorted(ROOT.glob(pattern)):
+            file = file.relative_to(ROOT).as_posix()
+            scenes.extend((file, name) for name in load_scenes(ROOT / file))
+    return scenes
+
+
+def peak_rss_mib() -> float | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+
+
+def measure_scene(file: str, scene_name: str, quality: str, renderer: str | None, write_to_movie: bool) -> dict:
+    counts = Counter()
+
+    def count(owner, name: str, key: str):
+        original = getattr(owner, name)
+
+        def counted(*args, **kwargs):
+            counts[key] += 1
+            return original(*args, **kwargs)
+
+        setattr(owner, name, counted)
+
+    count(tex_file_writing, "compile_tex", "tex_compiles")
+    count(Text, "_text2svg", "text_layouts")
+    count(MarkupText, "_text2svg", "text_layouts")
+    count(SceneFileWriter, "write_frame", "frames")
+
+    # frames of a static wait skip write_frame
+    write_repeated = static_frames.write_repeated
+
+    def counted_write_repeated(writer, frame, repeats: int):
+        counts["frames"] += repeats
+        return write_repeated(writer, frame, repeats)
+
+    static_frames.write_repeated = counted_write_repeated
+
+    animations = []
+    play = Scene.play
+
+    def timed_play(scene: Scene, *args, **kwargs):
+        frames = counts["frames"]
+        start = time.perf_counter()
+        try:
+            return play(scene, *args, **kwargs)
+        finally:
+            animations.append({
+                "animations": ", ".join(type(animation).__name__.lstrip("_") for animation in args),
+                "time": time.perf_counter() - start,
+                "frames": counts["frames"] - frames,
+            })
+
+    Scene.play = timed_play
+
+    start = time.perf_counter()
+    render_scene(
+        ROOT / file,
+        scene_name,
+        quality=quality,
+        renderer=renderer,
+        write_to_movie=write_to_movie,
+        disable_caching=True,
+        preview=False
+    )
+    total = time.perf_counter() - start
+
+    play_time = sum(animation["time"] for animation in animations)
+    return {
+        "total": total,
+        "construct": total - play_time,
+        "fps": counts["frames"] / play_time if play_time else None,
+        "frames": counts["frames"],
+        "peak_rss_mib": peak_rss_mib(),
+        "tex_compiles": counts["tex_compiles"],
+        "text_layouts": counts["text_layouts"],
+        "writer": frame_writer.stats.as_dict() if write_to_movie else None,
+        "animations": animations,
+    }
+
+
+def run(
+        scenes: List[Tuple[str, str]],
+        quality: str = "l",
+        renderer: str | None = None,
+        write_to_movie: bool = False
+) -> Dict[str, dict]:
+    results = {}
+    for file, scene_name in scenes:
+        key = f"{file}::{scene_name}"
+        # a fresh process per scene, so caches and peak memory do not carry over
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            try:
+                results[key] = pool.submit(
+                    measure_scene, file, scene_name, quality, renderer, write_to_movie
+                ).result()
+            except Exception as e:
+                logger.error(f"{key} failed: {e!r}")
+                results[key] = {"error": repr(e)}
+                continue
+
+        result = results[key]
+        logger.info(
+            f"{key}: {result['total']:.2f}s total, {result['construct']:.2f}s construct, "
+            f"{result['frames']} frames at {result['fps'] or 0:.1f} fps, "
+            f"{result['tex_compiles']} LaTeX runs, {result['text_layouts']} text layouts"
+        )
+    return results
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    """Describe every scene that got more than ``threshold`` slower, or bigger, than in ``baseline``."""
+    regressions = []
+    for key, result in results.items():
+        old = baseline.get(key)
+        if old is None or "error" in old:
+            continue
+        if "error" in result:
+            regressions.append(f"{key}: {result['error']}")
+            continue
+
+        for metric in ("total", "construct", "peak_rss_mib", "tex_compiles", "text_layouts"):
+            if old.get(metric) is None or result.get(metric) is None:
+                continue
+            if result[metric] > old[metric] * (1 + threshold) and result[metric] - old[metric] > 1e-2:
+                regressions.append(f"{key}: {metric} {old[metric]:.2f} -> {result[metric]:.2f}")
+        if old.get("fps") and result.get("fps") and result["fps"] < old["fps"] / (1 + threshold):
+            regressions.append(f"{key}: fps {old['fps']:.1f} -> {result['fps']:.1f}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", default=SCENE_FILES, help="glob patterns relative to the repo root")
+    parser.add_argument("-k", "--select", default="*", help="only scenes whose file::Scene matches this pattern")
+    parser.add_argument("-q", "--quality", default="l", help="l, m, h, p or k")
+    parser.add_argument("--renderer", default=None)
+    parser.add_argument("--write-to-movie", action="store_true", help="encode the movies too")
+    parser.add_argument("-o", "--output", type=Path, default=None, help="write the results to this JSON file")
+    parser.add_argument("--compare", type=Path, default=None, help="baseline JSON file to check against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative slowdown reported as a regression")
+    args = parser.parse_args()
+
+    scenes = [(file, name) for file, name in discover(args.files) if fnmatch.fnmatch(f"{file}::{name}", args.select)]
+    results = run(scenes, args.quality, args.renderer, args.write_to_movie)
+
+    if args.output is not None:
+        args.output.write_text(json.dumps({
+            "quality": args.quality,
+            "renderer": args.renderer,
+            "write_to_movie": args.write_to_movie,
+            "scenes": results,
+        }, indent=2), encoding="utf-8")
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline["scenes"], args.threshold)
+        for regression in regressions:
+            logger.warning(regression)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""A small content-addressed on-disk cache of NumPy arrays with LRU eviction.
+
+Several processes can share one cache directory: the index is read, merged
+with what the process knows and written back under a file lock.
+"""
+from __future__ import annotations
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+import numpy as np
+from manim import logger
+
+from common.render import ROOT
+
+CACHE_DIR = ROOT / "media" / "cache"
+
+
+class DiskCache:
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._index: Optional[Dict[str, dict]] = None
+
+    @property
+    def index_file(self) -> Path:
+        return self.directory / "index.json"
+
+    @property
+    def index(self) -> Dict[str, dict]:
+        if self._index is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._index = self.read_index()
+        return self._index
+
+    def read_index(self) -> Dict[str, dict]:
+        try:
+            return json.loads(self.index_file.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold the lock of the cache directory, shared with the other processes using it."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.directory / "index.lock", "a+b") as fp:
+            if fcntl is not None:
+                fcntl.flock(fp, fcntl.LOCK_EX)
+            else:
+                fp.seek(0)
+                msvcrt.locking(fp.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fp, fcntl.LOCK_UN)
+                else:
+                    fp.seek(0)
+                    msvcrt.locking(fp.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def refresh(self) -> None:
+        """Merge the index on disk, which other processes may have changed, into this one. Needs the lock."""
+        index = self.read_index()
+        for key, entry in (self._index or {}).items():
+            # entries missing on disk were evicted by another process
+            if key in index:
+                index[key]["used"] = max(index[key]["used"], entry["used"])
+        self._index = index
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}.npz"
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
+
+    def get(self, key: str) -> Optional[Dict[str, np.ndarray]]:
+        if key not in self.index:
+            # another process may have added it
+            with self.locked():
+                self.refresh()
+        if key in self.index:
+            try:
+                with np.load(self.path(key)) as data:
+                    arrays = dict(data)
+            except (OSError, ValueError):
+                del self.index[key]
+            else:
+                self.index[key]["used"] = time.time()
+                self.hits += 1
+                return arrays
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, arrays: Dict[str, np.ndarray]) -> None:
+        path = self.path(key)
+        tmp_path = path.with_name(f"{key}.{os.getpid()}.tmp.npz")
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, path)
+
+        with self.locked():
+            self.refresh()
+            self.index[key] = {"size": path.stat().st_size, "used": time.time()}
+            self.evict()
+            self.write_index()
+
+    def evict(self) -> None:
+        total = sum(entry["size"] for entry in self.index.values())
+        for key in sorted(self.index, key=lambda k: self.index[k]["used"]):
+            if total <= self.max_bytes:
+                break
+            total -= self.index.pop(key)["size"]
+            self.path(key).unlink(missing_ok=True)
+
+    def save_index(self) -> None:
+        if self._index is None:
+            return
+        with self.locked():
+            self.refresh()
+            self.write_index()
+
+    def write_index(self) -> None:
+        tmp_file = self.index_file.with_name(f"index.{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(self._index), encoding="utf-8")
+        os.replace(tmp_file, self.index_file)
+
+    def report(self, name: str) -> None:
+        total = self.hits + self.misses
+        if not total:
+            return
+        size = sum(entry["size"] for entry in self.index.values())
+        logger.info(
+            f"{name} cache: {self.hits} hits, {self.misses} misses ({self.hits / total:.0%}), "
+            f"{len(self.index)} entries, {size / 2 ** 20:.1f} MiB"
+        )
@@ -0,0 +1,166 @@
+"""Redraw only the part of the frame that changed since the previous one.
+
+The cairo renderer starts every frame from the static image and draws all
+moving mobjects over the whole frame, even when one small dot is all that
+moved. Once installed, the pixel bounds of every drawn mobject are kept
+between frames; the mobjects whose points or style changed mark their old
+and new bounds as damaged, only that rectangle is restored from the static
+image, and the mobjects are drawn again clipped to it.
+
+A frame falls back to a full redraw when the camera moved, the set of drawn
+mobjects changed, something other than a ``VMobject`` is drawn, or the
+damage covers more than ``max_fraction`` of the frame. The mean fraction of
+pixels redrawn is logged when the process exits.
+
+    from common.dirty_rects import dirty_rects
+    dirty_rects.install()
+
+Only the cairo renderer is patched. The OpenGL renderer, which ``manim.cfg``
+selects for Python entry points, redraws the whole frame on the GPU; under
+it ``install`` warns and leaves manim as it is.
+"""
+from __future__ import annotations
+
+import atexit
+import hashlib
+from typing import Dict, Tuple
+
+import numpy as np
+from manim import RendererType, ThreeDCamera, VMobject, config, logger
+from manim.renderer.cairo_renderer import CairoRenderer
+
+from common.background_layer import digest_camera, digest_mobject
+
+Box = Tuple[int, int, int, int]
+
+
+class DirtyRects:
+    def __init__(self, max_fraction: float = 0.5):
+        self.max_fraction = max_fraction
+        self.frames = 0
+        self.full_frames = 0
+        # sum over frames of the fraction of pixels redrawn
+        self.redrawn = 0.0
+        self._installed = False
+
+    @staticmethod
+    def pixel_box(camera, mob: VMobject) -> Box | None:
+        """Pixels ``mob`` can cover, its points' bounds grown by the stroke and antialiasing."""
+        if not len(mob.points):
+            return None
+        scale_x = camera.pixel_width / camera.frame_width
+        scale_y = camera.pixel_height / camera.frame_height
+        low, high = mob.points.min(axis=0), mob.points.max(axis=0)
+        x0, x1 = (np.array([low[0], high[0]]) - camera.frame_center[0]) * scale_x + camera.pixel_width / 2
+        y0, y1 = (camera.frame_center[1] - np.array([high[1], low[1]])) * scale_y + camera.pixel_height / 2
+
+        width = max(mob.get_stroke_width(), mob.get_stroke_width(background=True))
+        # miter joins reach out to 10 half widths
+        margin = 5 * width * camera.cairo_line_width_multiple * scale_x + 2
+        return int(x0 - margin), int(y0 - margin), int(np.ceil(x1 + margin)), int(np.ceil(y1 + margin))
+
+    def damage(self, renderer: CairoRenderer, mobjects, include_submobjects: bool, kwargs: dict) -> Box | None:
+        """The rectangle to redraw, ``None`` if the whole frame has to be."""
+        camera = renderer.camera
+        state = renderer.__dict__.pop("damage_state", None)
+        if not mobjects or isinstance(camera, ThreeDCamera):
+            return None
+        displayed = camera.get_mobjects_to_display(mobjects, include_submobjects=include_submobjects, **kwargs)
+        if not all(isinstance(mob, VMobject) for mob in displayed):
+            return None
+
+        drawn: Dict[int, Tuple[bytes, Box | None]] = {}
+        for mob in displayed:
+            digest = hashlib.blake2b(digest_size=16)
+            digest_mobject(digest, mob)
+            drawn[id(mob)] = digest.digest(), self.pixel_box(camera, mob)
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest_camera(digest, camera)
+        base = renderer.static_image if renderer.static_image is not None else camera.background
+        # the previous frame is still in the pixel array only if it was drawn from the same base and mobjects
+        key = id(base), id(camera.pixel_array), digest.digest(), tuple(drawn)
+        renderer.damage_state = key, drawn
+        if state is None or state[0] != key:
+            return None
+
+        boxes = []
+        for i, (mob_digest, box) in drawn.items():
+            old_digest, old_box = state[1][i]
+            if mob_digest != old_digest:
+                boxes += [b for b in (old_box, box) if b is not None]
+        if not boxes:
+            return 0, 0, 0, 0
+
+        boxes = np.array(boxes)
+        x0, y0 = np.maximum(boxes[:, :2].min(axis=0), 0)
+        x1, y1 = np.minimum(boxes[:, 2:].max(axis=0), [camera.pixel_width, camera.pixel_height])
+        return int(x0), int(y0), int(max(x1, x0)), int(max(y1, y0))
+
+    def redraw(self, renderer: CairoRenderer, box: Box, mobjects, include_submobjects: bool, kwargs: dict) -> None:
+        camera = renderer.camera
+        x0, y0, x1, y1 = box
+        if x1 == x0 or y1 == y0:
+            return
+
+        base = renderer.static_image if renderer.static_image is not None else camera.background
+        camera.pixel_array[y0:y1, x0:x1] = base[y0:y1, x0:x1]
+        ctx = camera.get_cairo_context(camera.pixel_array)
+        ctx.get_target().mark_dirty_rectangle(x0, y0, x1 - x0, y1 - y0)
+
+        # the clip is given in pixels, the context draws in frame units
+        matrix = ctx.get_matrix()
+        ctx.identity_matrix()
+        ctx.new_path()
+        ctx.rectangle(x0, y0, x1 - x0, y1 - y0)
+        ctx.set_matrix(matrix)
+        ctx.clip()
+        try:
+            displayed = camera.get_mobjects_to_display(mobjects, include_submobjects=include_submobjects, **kwargs)
+            camera.display_multiple_vectorized_mobjects(displayed, camera.pixel_array)
+        finally:
+            ctx.reset_clip()
+
+    def install(self) -> None:
+        if self._installed:
+            return
+        if config.renderer != RendererType.CAIRO:
+            logger.warning(f"Dirty rectangles only apply to the cairo renderer, not installed for {config.renderer.value}")
+            return
+        self._installed = True
+
+        update_frame = CairoRenderer.update_frame
+
+        def damage_update_frame(
+                renderer: CairoRenderer,
+                scene,
+                mobjects=None,
+                include_submobjects: bool = True,
+                ignore_skipping: bool = True,
+                **kwargs
+        ):
+            if renderer.skip_animations and not ignore_skipping:
+                return
+            self.frames += 1
+            box = self.damage(renderer, mobjects, include_submobjects, kwargs)
+            total = renderer.camera.pixel_width * renderer.camera.pixel_height
+            if box is not None and (box[2] - box[0]) * (box[3] - box[1]) <= self.max_fraction * total:
+                self.redrawn += (box[2] - box[0]) * (box[3] - box[1]) / total
+                return self.redraw(renderer, box, mobjects, include_submobjects, kwargs)
+
+            self.full_frames += 1
+            self.redrawn += 1
+            return update_frame(renderer, scene, mobjects, include_submobjects, ignore_skipping, **kwargs)
+
+        CairoRenderer.update_frame = damage_update_frame
+        atexit.register(self.report)
+
+    def report(self) -> None:
+        if self.frames:
+            logger.info(
+                f"Dirty rectangles: {self.redrawn / self.frames:.1%} of the pixels redrawn per frame, "
+                f"{self.full_frames} of {self.frames} frames redrawn in full"
+            )
+
+
+dirty_rects = DirtyRects()
@@ -0,0 +1,164 @@
+"""``Line`` and ``Angle`` that follow trackers by rewriting their own points.
+
+Updaters like ``lambda m: m.become(Angle(line1, line2))`` build a whole new
+mobject every frame only to copy its points over. ``FastLine`` and
+``FastAngle`` compute their points in closed form and write them into the
+existing point array, and ``FastAngle.arc_midpoint`` answers where a label
+goes without building a second arc.
+
+    from common.fast_geometry import FastAngle, FastLine
+    line = FastLine(LEFT, RIGHT)
+    line.add_updater(lambda m: m.set_angle(tracker.get_value(), about_point=LEFT))
+    angle = FastAngle(Line(LEFT, RIGHT), line, radius=0.5)
+    angle.add_updater(lambda m: m.match_lines())
+"""
+from __future__ import annotations
+
+import numpy as np
+from manim import LEFT, RIGHT, TAU, Angle, Line
+from manim.utils.space_ops import angle_of_vector, line_intersection
+
+
+def _refresh(mob) -> None:
+    # OpenGL mobjects cache their bounding box and fill triangulation
+    if hasattr(mob, "refresh_triangulation"):
+        mob.refresh_bounding_box()
+        mob.refresh_triangulation()
+
+
+class FastLine(Line):
+    """A straight ``Line`` (no ``path_arc``) whose ends can be moved in place."""
+
+    def __init__(self, start: np.ndarray = LEFT, end: np.ndarray = RIGHT, **kwargs):
+        super().__init__(start, end, **kwargs)
+        if self.path_arc:
+            raise ValueError("FastLine only draws straight lines")
+        self._weights = np.linspace(0, 1, self.n_points_per_curve)[:, None]
+
+    def set_points_from(self, start: np.ndarray, end: np.ndarray) -> FastLine:
+        # copies, the ends may be views of the points about to be overwritten
+        start, end = np.array(start, dtype=float), np.array(end, dtype=float)
+        self.start, self.end = start, end
+        # as Line._account_for_buff: no buff on a line shorter than both of them
+        length = np.linalg.norm(end - start)
+        if self.buff and length >= 2 * self.buff:
+            direction = (end - start) * self.buff / length
+            start, end = start + direction, end - direction
+
+        if len(self.points) != len(self._weights):
+            self.set_points(np.empty((len(self._weights), 3)))
+        np.multiply(self._weights, end - start, out=self.points)
+        self.points += start
+        _refresh(self)
+        return self
+
+    def set_angle(self, angle: float, about_point: np.ndarray | None = None) -> FastLine:
+        """Rotate the line in the xy plane so that it points at ``angle``, about its start by default."""
+        # the ends before buff, which set_points_from takes off again
+        start, end = self.start, self.end
+        about_point = start if about_point is None else np.asarray(about_point, dtype=float)
+
+        delta = angle - angle_of_vector(end - start)
+        cos, sin = np.cos(delta), np.sin(delta)
+        rotation = np.array([[cos, -sin, 0], [sin, cos, 0], [0, 0, 1]])
+        return self.set_points_from(
+            about_point + (start - about_point) @ rotation.T,
+            about_point + (end - about_point) @ rotation.T,
+        )
+
+
+class FastAngle(Angle):
+    """An arc ``Angle`` (no ``elbow`` or ``dot``) that is redrawn in place."""
+
+    def __init__(self, line1: Line, line2: Line, radius: float | None = None, other_angle: bool = False, **kwargs):
+        if kwargs.get("elbow") or kwargs.get("dot"):
+            raise ValueError("FastAngle only draws plain arcs")
+        super().__init__(line1, line2, radius=radius, other_angle=other_angle, **kwargs)
+        self.other_angle = other_angle
+        self._auto_radius = radius is None
+
+        # anchors of the cubic arc, or anchors and handles of the quadratic one
+        n = self.n_points_per_curve
+        curves = len(self.points) // n
+        self._steps = np.linspace(0, 1, curves * (2 if n == 3 else 1) + 1)
+        self._angles = np.empty_like(self._steps)
+        self._cos = np.empty_like(self._steps)
+        self._sin = np.empty_like(self._steps)
+        self.match_lines()
+
+    def match_lines(self) -> FastAngle:
+        """Redraw the arc between the current positions of the two lines, the way ``Angle`` places it."""
+        line1, line2 = self.lines
+        center = line_intersection([line1.get_start(), line1.get_end()], [line2.get_start(), line2.get_end()])
+
+        radius = getattr(self, "radius", None)
+        if self._auto_radius:
+            ends = [
+                line.get_end() if quadrant == 1 else line.get_start()
+                for line, quadrant in zip(self.lines, self.quadrant)
+            ]
+            distance = min(np.linalg.norm(end - center) for end in ends)
+            radius = 2 / 3 * distance if distance < 0.6 else 0.4
+
+        angle_1, angle_2 = (
+            np.arctan2(quadrant * unit[1], quadrant * unit[0])
+            for unit, quadrant in zip((line1.get_unit_vector(), line2.get_unit_vector()), self.quadrant)
+        )
+        if not self.other_angle:
+            angle = angle_2 - angle_1 if angle_2 > angle_1 else TAU - (angle_1 - angle_2)
+        else:
+            angle = angle_2 - angle_1 if angle_2 < angle_1 else -TAU + (angle_2 - angle_1)
+
+        return self.set_angle(angle, angle_1, center, radius)
+
+    def set_angle(
+            self,
+            angle: float,
+            start_angle: float | None = None,
+            arc_center: np.ndarray | None = None,
+            radius: float | None = None
+    ) -> FastAngle:
+        """Sweep ``angle`` from ``start_angle``, keeping whatever is not given."""
+        self.angle_value = angle
+        if start_angle is not None:
+            self.start_angle = start_angle
+        if arc_center is not None:
+            self.arc_center = np.asarray(arc_center, dtype=float)
+        if radius is not None:
+            self.radius = radius
+
+        np.multiply(self._steps, angle, out=self._angles)
+        self._angles += self.start_angle
+        np.cos(self._angles, out=self._cos)
+        np.sin(self._angles, out=self._sin)
+
+        if not self.points.flags.c_contiguous:
+            self.points = np.ascontiguousarray(self.points)
+        n = self.n_points_per_curve
+        curves = self.points.reshape(-1, n, 3)
+        cos, sin = self._cos, self._sin
+        if n == 4:
+            # same handles as Arc: along the tangents, a third of the step away
+            d = angle / len(curves) / 3
+            curves[:, 0, 0], curves[:, 0, 1] = cos[:-1], sin[:-1]
+            curves[:, 1, 0], curves[:, 1, 1] = cos[:-1] - d * sin[:-1], sin[:-1] + d * cos[:-1]
+            curves[:, 2, 0], curves[:, 2, 1] = cos[1:] + d * sin[1:], sin[1:] - d * cos[1:]
+            curves[:, 3, 0], curves[:, 3, 1] = cos[1:], sin[1:]
+        else:
+            # quadratic handles sit where the tangents at both anchors meet
+            scale = 1 / np.cos(angle / len(curves) / 2)
+            curves[:, 0, 0], curves[:, 0, 1] = cos[0:-1:2], sin[0:-1:2]
+            curves[:, 1, 0], curves[:, 1, 1] = cos[1::2] * scale, sin[1::2] * scale
+            curves[:, 2, 0], curves[:, 2, 1] = cos[2::2], sin[2::2]
+
+        curves[:, :, 2] = 0
+        curves *= self.radius
+        curves += self.arc_center
+        _refresh(self)
+        return self
+
+    def arc_midpoint(self, radius: float | None = None) -> np.ndarray:
+        """The point halfway along the arc, or along a concentric arc of ``radius``."""
+        middle = self.start_angle + self.angle_value / 2
+        radius = self.radius if radius is None else radius
+        return self.arc_center + radius * np.array([np.cos(middle), np.sin(middle), 0])
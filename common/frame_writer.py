@@ -0,0 +1,185 @@
+"""Hand frames to ffmpeg from a writer thread, through a ring of reusable buffers.
+
+``SceneFileWriter.write_frame`` writes every frame to ffmpeg's stdin on the
+main thread, so the renderer waits for the encoder on every frame. Once
+installed, a frame is copied into the next free buffer of a small ring and a
+writer thread feeds the filled buffers to ffmpeg, so frame N is encoded while
+frame N + 1 is rasterized. The renderer only blocks when the whole ring is
+waiting for the encoder.
+
+The time each side spends waiting for the other tells which one is the
+bottleneck, and is logged when the process exits:
+
+* ``render_wait``: the renderer found no free buffer, the encoder is behind
+* ``encoder_wait``: the writer thread found no frame, the renderer is behind
+
+    from common.frame_writer import frame_writer
+    frame_writer.install()
+"""
+from __future__ import annotations
+
+import atexit
+import queue
+import threading
+import time
+from typing import List
+
+import numpy as np
+from manim import config, logger
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import is_png_format
+
+
+class FrameWriterStats:
+    def __init__(self):
+        self.frames = 0
+        self.render_wait = 0.0
+        self.encoder_wait = 0.0
+        # queue depth seen by every new frame
+        self.depth_total = 0
+        self.depth_max = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "frames": self.frames,
+            "render_wait": self.render_wait,
+            "encoder_wait": self.encoder_wait,
+            "mean_queue_depth": self.depth_total / self.frames if self.frames else 0,
+            "max_queue_depth": self.depth_max,
+        }
+
+
+class FrameRing:
+    """The buffers and writer thread of one ffmpeg process."""
+
+    def __init__(self, stdin, size: int, stats: FrameWriterStats):
+        self.stdin = stdin
+        self.size = size
+        self.stats = stats
+        self.buffers: List[np.ndarray] = []
+        self.free: queue.Queue[int] = queue.Queue()
+        # buffer index and how many times in a row the frame is written
+        self.filled: queue.Queue[tuple[int, int] | None] = queue.Queue()
+        self.error: BaseException | None = None
+        self.thread = threading.Thread(target=self._write, name="frame-writer", daemon=True)
+        self.thread.start()
+
+    def _write(self) -> None:
+        while True:
+            start = time.perf_counter()
+            item = self.filled.get()
+            self.stats.encoder_wait += time.perf_counter() - start
+            if item is None:
+                return
+            index, count = item
+            try:
+                for _ in range(count if self.error is None else 0):
+                    self.stdin.write(self.buffers[index].data)
+            except BaseException as e:
+                # raised on the main thread by the next put or close
+                self.error = e
+            finally:
+                self.free.put(index)
+
+    def _check(self) -> None:
+        if self.error is not None:
+            raise self.error
+
+    def put(self, frame: np.ndarray, count: int = 1) -> None:
+        """Queue ``frame`` to be written ``count`` times, copying it once."""
+        self._check()
+        if not self.buffers or self.buffers[0].shape != frame.shape:
+            self._allocate(frame)
+
+        start = time.perf_counter()
+        index = self.free.get()
+        self.stats.render_wait += time.perf_counter() - start
+
+        np.copyto(self.buffers[index], frame)
+        self.filled.put((index, count))
+        self.stats.frames += count
+        self.stats.depth_total += self.filled.qsize()
+        self.stats.depth_max = max(self.stats.depth_max, self.filled.qsize())
+
+    def _allocate(self, frame: np.ndarray) -> None:
+        # wait for the thread to release every buffer of the previous shape
+        for _ in range(len(self.buffers)):
+            self.free.get()
+        self.buffers = [np.empty_like(frame) for _ in range(self.size)]
+        for index in range(self.size):
+            self.free.put(index)
+
+    def close(self) -> None:
+        self.filled.put(None)
+        self.thread.join()
+        self._check()
+
+
+class ThreadedFrameWriter:
+    def __init__(self, ring_size: int = 4):
+        self.ring_size = ring_size
+        self.stats = FrameWriterStats()
+        self._installed = False
+
+    def install(self) -> None:
+        if self._installed:
+            return
+        self._installed = True
+
+        open_movie_pipe = SceneFileWriter.open_movie_pipe
+        close_movie_pipe = SceneFileWriter.close_movie_pipe
+        write_frame = SceneFileWriter.write_frame
+        write_opengl_frame = SceneFileWriter.write_opengl_frame
+        render = CairoRenderer.render
+
+        def threaded_open_movie_pipe(writer: SceneFileWriter, *args, **kwargs):
+            open_movie_pipe(writer, *args, **kwargs)
+            writer.frame_ring = FrameRing(writer.writing_process.stdin, self.ring_size, self.stats)
+
+        def threaded_close_movie_pipe(writer: SceneFileWriter):
+            ring = writer.__dict__.pop("frame_ring", None)
+            if ring is not None:
+                ring.close()
+            close_movie_pipe(writer)
+
+        def threaded_write_frame(writer: SceneFileWriter, frame_or_renderer):
+            ring = getattr(writer, "frame_ring", None)
+            if ring is None or not isinstance(frame_or_renderer, np.ndarray):
+                return write_frame(writer, frame_or_renderer)
+            ring.put(frame_or_renderer)
+            if is_png_format() and not config.dry_run:
+                writer.output_image_from_array(frame_or_renderer)
+
+        def threaded_write_opengl_frame(writer: SceneFileWriter, renderer):
+            ring = getattr(writer, "frame_ring", None)
+            if ring is None:
+                return write_opengl_frame(writer, renderer)
+            ring.put(np.frombuffer(renderer.get_raw_frame_buffer_object_data(), dtype=np.uint8))
+
+        def render_without_copy(renderer: CairoRenderer, scene, time, moving_mobjects):
+            if getattr(renderer.file_writer, "frame_ring", None) is None:
+                return render(renderer, scene, time, moving_mobjects)
+            # the ring copies the frame, get_frame's copy is not needed
+            renderer.update_frame(scene, moving_mobjects)
+            renderer.add_frame(renderer.camera.pixel_array)
+
+        SceneFileWriter.open_movie_pipe = threaded_open_movie_pipe
+        SceneFileWriter.close_movie_pipe = threaded_close_movie_pipe
+        SceneFileWriter.write_frame = threaded_write_frame
+        SceneFileWriter.write_opengl_frame = threaded_write_opengl_frame
+        CairoRenderer.render = render_without_copy
+        atexit.register(self.report)
+
+    def report(self) -> None:
+        stats = self.stats.as_dict()
+        if not stats["frames"]:
+            return
+        logger.info(
+            f"Frame writer: {stats['frames']} frames, mean queue depth {stats['mean_queue_depth']:.2f} "
+            f"of {self.ring_size} (max {stats['max_queue_depth']}), renderer waited {stats['render_wait']:.2f}s, "
+            f"encoder waited {stats['encoder_wait']:.2f}s"
+        )
+
+
+frame_writer = ThreadedFrameWriter()
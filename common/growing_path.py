@@ -0,0 +1,103 @@
+"""A path that grows one corner at a time, for traces drawn by updaters.
+
+Copying the path and calling ``become`` on every frame makes frame N cost
+O(N). ``GrowingPath`` keeps its points in a preallocated buffer that doubles
+when it is full and ``points`` is a view of the filled part, so appending a
+corner costs the same however long the trace already is.
+
+With a ``tolerance``, ``append`` stretches the last segment instead of adding
+a new one while every point it replaces stays within that distance of it, so
+straight or slowly bending stretches do not pile up curves. Distances are
+measured in the xy plane; points leaving the plane of the segment start a new
+one.
+
+    from common.growing_path import GrowingPath
+    path = GrowingPath(dot.get_center())
+    path.add_updater(lambda p: p.append(dot.get_center()))
+"""
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import numpy as np
+from manim import ORIGIN, VMobject
+
+
+class GrowingPath(VMobject):
+    def __init__(self, start: np.ndarray = ORIGIN, capacity: int = 256, tolerance: float = 0, **kwargs):
+        super().__init__(**kwargs)
+        self.tolerance = tolerance
+        # end of the last segment and the directions it may still be stretched in
+        self._cone: Optional[Tuple[np.ndarray, float, float]] = None
+        self._start = np.array(start, dtype=float)
+        self._buffer = np.empty((capacity, 3))
+        self._size = 0
+
+    @property
+    def last_point(self) -> np.ndarray:
+        return self.points[-1] if len(self.points) else self._start
+
+    def _reserve(self, count: int) -> None:
+        if self.points.base is not self._buffer or len(self.points) != self._size:
+            # points were replaced from outside (copy, become, a Transform), take them over
+            self._size = len(self.points)
+            self._buffer = np.concatenate([self.points, np.empty((max(self._size, count, 1), 3))])
+
+        if self._size + count > len(self._buffer):
+            buffer = np.empty((max(2 * len(self._buffer), self._size + count), 3))
+            buffer[:self._size] = self._buffer[:self._size]
+            self._buffer = buffer
+
+    def extend(self, points: np.ndarray) -> GrowingPath:
+        """Add straight segments from the current end through ``points``."""
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        if not len(points):
+            return self
+
+        starts = np.vstack([self.last_point, points[:-1]])
+        t = np.linspace(0, 1, self.n_points_per_curve)[None, :, None]
+        curves = (starts[:, None] + t * (points - starts)[:, None]).reshape(-1, 3)
+
+        self._reserve(len(curves))
+        self._buffer[self._size:self._size + len(curves)] = curves
+        self._size += len(curves)
+        self.points = self._buffer[:self._size]
+        self._refresh()
+        return self
+
+    def _refresh(self) -> None:
+        # OpenGL mobjects cache their bounding box and fill triangulation
+        if hasattr(self, "refresh_triangulation"):
+            self.refresh_bounding_box()
+            self.refresh_triangulation()
+
+    def _cone_of(self, start: np.ndarray, point: np.ndarray) -> Tuple[float, float]:
+        """Directions from ``start`` of the lines passing within ``tolerance`` of ``point``."""
+        x, y, _ = point - start
+        distance = np.hypot(x, y)
+        return np.arctan2(y, x), np.arcsin(min(1.0, self.tolerance / distance)) if distance else np.pi
+
+    def append(self, point: np.ndarray) -> GrowingPath:
+        point = np.asarray(point, dtype=float)
+        if np.array_equal(point, self.last_point):
+            return self
+
+        n = self.n_points_per_curve
+        start = self.points[-n] if len(self.points) >= n else None
+        cone = self._cone if self._cone is not None and np.array_equal(self._cone[0], self.last_point) else None
+        if self.tolerance and cone is not None and point[2] == start[2]:
+            # stretch the last segment while every point it replaced stays within tolerance of it
+            _, center, half = cone
+            direction, width = self._cone_of(start, point)
+            offset = (direction - center + np.pi) % (2 * np.pi) - np.pi
+            if abs(offset) <= half and np.dot(self.last_point - start, point - self.last_point) >= 0:
+                low, high = max(-half, offset - width), min(half, offset + width)
+                self._cone = (point, center + (low + high) / 2, (high - low) / 2)
+                self.points[-n:] = start + np.linspace(0, 1, n)[:, None] * (point - start)
+                self._refresh()
+                return self
+
+        start = self.last_point.copy()
+        self.extend([point])
+        self._cone = (point, *self._cone_of(start, point))
+        return self
@@ -0,0 +1,302 @@
+"""Many copies of one shape, stored as arrays instead of one mobject each.
+
+A ``VGroup`` of twenty squares is twenty mobjects, each with its own points,
+colours and draw call, and ``AnimationGroup(*[FadeIn(s) for s in squares])``
+interpolates twenty copies of them. ``InstancedGroup`` keeps the template's
+points once, plus an offset, scale, angle and fill and stroke colour per
+instance. The points of every instance are computed in one vectorized step
+and merged into one path per distinct colour, so instances of the same colour
+are drawn together.
+
+    from common.instanced_group import InstancedGroup, LaggedFade
+    squares = InstancedGroup(Square(fill_opacity=0.5), 20).set_instance_colors(colors).arrange_in_grid(4, 5)
+    self.play(LaggedFade(squares, lag_ratio=0.2))
+
+Instances are changed through the arrays (``offsets``, ``scales``, ``angles``,
+``instance_fill_rgbas``, ``instance_stroke_rgbas``) followed by
+``update_instances()``, or with the methods below; ``Transform`` and
+``.animate`` only see the merged paths. The colour arrays are not the
+``fill_rgbas``/``stroke_rgbas`` of the group itself, which ``set_fill``,
+``match_style`` and manim's animations restyle as a whole.
+
+Merging changes what is drawn where instances overlap: translucent instances
+of one colour are filled as one path and no longer blend over each other, and
+the fill follows the winding of the merged path. It pays off for hundreds of
+animated instances that do not overlap; a few static copies are drawn as fast
+from a ``VGroup``, which the scenes of this repo keep using.
+"""
+from __future__ import annotations
+
+from math import ceil, sqrt
+from typing import Sequence
+
+import numpy as np
+from manim import (
+    DEFAULT_MOBJECT_TO_MOBJECT_BUFFER, MED_SMALL_BUFF, ORIGIN, OUT, RIGHT, Animation, ManimColor, VMobject,
+    color_to_rgb, linear, smooth
+)
+
+
+def _rgba(color, opacity: float) -> np.ndarray:
+    return np.array([*color_to_rgb(color), opacity])
+
+
+class InstancedGroup(VMobject):
+    def __init__(
+            self,
+            template: VMobject,
+            n: int,
+            offsets: np.ndarray | None = None,
+            scales: np.ndarray | float = 1,
+            angles: np.ndarray | float = 0,
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        # the template's points about its own centre
+        self.template_points = template.points - template.get_center()
+        self.template_size = np.array([template.width, template.height, template.depth])
+
+        self.offsets = np.zeros((n, 3)) if offsets is None else np.array(offsets, dtype=float).reshape(n, 3)
+        self.scales = np.broadcast_to(np.asarray(scales, dtype=float), (n,)).copy()
+        self.angles = np.broadcast_to(np.asarray(angles, dtype=float), (n,)).copy()
+        fill = _rgba(template.get_fill_color(), template.get_fill_opacity())
+        stroke = _rgba(template.get_stroke_color(), template.get_stroke_opacity())
+        self.instance_fill_rgbas = np.tile(fill, (n, 1))
+        self.instance_stroke_rgbas = np.tile(stroke, (n, 1))
+        self.instance_stroke_width = template.get_stroke_width()
+
+        self._batches: list[VMobject] = []
+        self.update_instances()
+
+    @property
+    def n_instances(self) -> int:
+        return len(self.offsets)
+
+    def instance_points(self) -> np.ndarray:
+        """The points of every instance, shaped ``(n, points per instance, 3)``."""
+        x, y, z = self.template_points.T
+        scales = self.scales[:, None]
+        cos, sin = np.cos(self.angles)[:, None], np.sin(self.angles)[:, None]
+
+        points = np.empty((self.n_instances, len(self.template_points), 3))
+        points[..., 0] = scales * (cos * x - sin * y)
+        points[..., 1] = scales * (sin * x + cos * y)
+        points[..., 2] = scales * z
+        points += self.offsets[:, None, :]
+        return points
+
+    def update_instances(self) -> InstancedGroup:
+        """Redraw the instances from the arrays, after they were changed in place."""
+        points = self.instance_points()
+        stroked = (self.instance_stroke_rgbas[:, 3] > 0) & (self.instance_stroke_width > 0)
+        visible = (self.instance_fill_rgbas[:, 3] > 0) | stroked
+
+        # colours as 8 bit, like the renderer; each distinct colour is one path
+        keys = np.round(np.hstack([self.instance_fill_rgbas, self.instance_stroke_rgbas]) * 255)[visible]
+        colors, batch_of = np.unique(keys, axis=0, return_inverse=True)
+        batch_of = batch_of.reshape(-1)
+        points = points[visible]
+
+        while len(self._batches) < len(colors):
+            self._batches.append(VMobject())
+        batches = self._batches[:len(colors)]
+        for i, (batch, color) in enumerate(zip(batches, colors / 255)):
+            batch.set_points(points[batch_of == i].reshape(-1, 3))
+            batch.set_fill(ManimColor(color[:3]), opacity=color[3])
+            batch.set_stroke(ManimColor(color[4:7]), width=self.instance_stroke_width, opacity=color[7])
+            if hasattr(batch, "refresh_triangulation"):
+                batch.refresh_triangulation()
+
+        self.submobjects = list(batches)
+        # OpenGL mobjects cache their family
+        if hasattr(self, "assemble_family"):
+            self.assemble_family()
+        return self
+
+    def get_instance_bounds(self) -> np.ndarray:
+        points = self.instance_points().reshape(-1, 3)
+        return np.array([points.min(axis=0), points.max(axis=0)])
+
+    def get_instance_center(self) -> np.ndarray:
+        return self.get_instance_bounds().mean(axis=0)
+
+    def _about_point(self, about_point: np.ndarray | None, about_edge: np.ndarray | None) -> np.ndarray:
+        if about_point is not None:
+            return np.asarray(about_point, dtype=float)
+        low, high = self.get_instance_bounds()
+        edge = ORIGIN if about_edge is None else np.asarray(about_edge)
+        return (low + high) / 2 + edge * (high - low) / 2
+
+    def shift(self, *vectors: np.ndarray) -> InstancedGroup:
+        self.offsets += np.sum(vectors, axis=0)
+        return self.update_instances()
+
+    def scale(
+            self,
+            scale_factor: float,
+            about_point: np.ndarray | None = None,
+            about_edge: np.ndarray | None = None,
+            **kwargs
+    ) -> InstancedGroup:
+        about_point = self._about_point(about_point, about_edge)
+        self.offsets = about_point + (self.offsets - about_point) * scale_factor
+        self.scales *= scale_factor
+        return self.update_instances()
+
+    def rotate(
+            self,
+            angle: float,
+            axis: np.ndarray = OUT,
+            about_point: np.ndarray | None = None,
+            **kwargs
+    ) -> InstancedGroup:
+        if not np.allclose(axis, OUT):
+            raise ValueError("InstancedGroup only rotates in the xy plane")
+        about_point = self._about_point(about_point, kwargs.get("about_edge"))
+        cos, sin = np.cos(angle), np.sin(angle)
+        rotation = np.array([[cos, -sin, 0], [sin, cos, 0], [0, 0, 1]])
+        self.offsets = about_point + (self.offsets - about_point) @ rotation.T
+        self.angles += angle
+        return self.update_instances()
+
+    def move_to(self, point_or_mobject, aligned_edge: np.ndarray = ORIGIN, **kwargs) -> InstancedGroup:
+        if hasattr(point_or_mobject, "get_critical_point"):
+            target = point_or_mobject.get_critical_point(aligned_edge)
+        else:
+            target = np.asarray(point_or_mobject, dtype=float)
+        return self.shift(target - self._about_point(None, aligned_edge))
+
+    def center(self) -> InstancedGroup:
+        return self.move_to(ORIGIN)
+
+    def set_instance_colors(
+            self,
+            colors: Sequence,
+            fill: bool = True,
+            stroke: bool = True
+    ) -> InstancedGroup:
+        """Give instance ``i`` the colour ``colors[i]``, keeping the opacities."""
+        rgbs = np.array([color_to_rgb(color) for color in colors])
+        if fill:
+            self.instance_fill_rgbas[:, :3] = rgbs
+        if stroke:
+            self.instance_stroke_rgbas[:, :3] = rgbs
+        return self.update_instances()
+
+    def set_instance_opacity(self, opacity: np.ndarray | float, fill: bool = True, stroke: bool = True) -> InstancedGroup:
+        if fill:
+            self.instance_fill_rgbas[:, 3] = opacity
+        if stroke:
+            self.instance_stroke_rgbas[:, 3] = opacity
+        return self.update_instances()
+
+    def _instance_sizes(self) -> np.ndarray:
+        # rotations are not accounted for, like arranging rotated mobjects by their bounding boxes
+        return self.scales[:, None] * self.template_size
+
+    def arrange(
+            self,
+            direction: np.ndarray = RIGHT,
+            buff: float = DEFAULT_MOBJECT_TO_MOBJECT_BUFFER,
+            center: bool = True,
+            **kwargs
+    ) -> InstancedGroup:
+        """Line the instances up along an axis-aligned ``direction``, ``buff`` apart."""
+        direction = np.asarray(direction, dtype=float)
+        lengths = self._instance_sizes() @ np.abs(direction)
+        along = np.cumsum(lengths + buff) - lengths / 2 - buff
+        self.offsets = self.offsets[0] + np.outer(along - along[0], direction)
+        if center:
+            self.center()
+        return self.update_instances()
+
+    def arrange_in_grid(
+            self,
+            rows: int | None = None,
+            cols: int | None = None,
+            buff: float | tuple[float, float] = MED_SMALL_BUFF,
+            **kwargs
+    ) -> InstancedGroup:
+        """Place the instances row by row in equal cells, as large as the largest instance."""
+        start = self.get_instance_center()
+        n = self.n_instances
+        if rows is None and cols is None:
+            rows = ceil(sqrt(n))
+        if cols is None:
+            cols = ceil(n / rows)
+        if rows is None:
+            rows = ceil(n / cols)
+        buff_x, buff_y = buff if isinstance(buff, tuple) else (buff, buff)
+
+        width, height, _ = self._instance_sizes().max(axis=0)
+        i = np.arange(n)
+        self.offsets[:, 0] = (i % cols - (cols - 1) / 2) * (width + buff_x)
+        self.offsets[:, 1] = ((rows - 1) / 2 - i // cols) * (height + buff_y)
+        self.offsets[:, 2] = 0
+        self.offsets += start
+        return self.update_instances()
+
+
+class LaggedFade(Animation):
+    """``AnimationGroup(*[FadeIn(m, shift=shift) for m in group], lag_ratio=lag_ratio)`` over the instances.
+
+    Every instance fades for one unit of time, each starting ``lag_ratio`` of a
+    unit after the previous one; ``rate_func`` applies to each instance.
+    """
+
+    def __init__(
+            self,
+            group: InstancedGroup,
+            fade_in: bool = True,
+            lag_ratio: float = 0.2,
+            shift: np.ndarray = ORIGIN,
+            rate_func=smooth,
+            **kwargs
+    ):
+        self.fade_in = fade_in
+        self.shift_vector = np.asarray(shift, dtype=float)
+        self.instance_rate_func = rate_func
+        duration = (group.n_instances - 1) * lag_ratio + 1
+        self.starts = np.arange(group.n_instances) * lag_ratio / duration
+        self.instance_time = 1 / duration
+        kwargs.setdefault("run_time", duration)
+        super().__init__(
+            group,
+            rate_func=linear,
+            introducer=fade_in,
+            remover=not fade_in,
+            **kwargs
+        )
+
+    def begin(self) -> None:
+        group = self.mobject
+        self.arrays = (
+            group.offsets.copy(),
+            group.instance_fill_rgbas[:, 3].copy(),
+            group.instance_stroke_rgbas[:, 3].copy()
+        )
+        super().begin()
+
+    def create_starting_mobject(self) -> InstancedGroup:
+        # the arrays saved in begin are all the starting state needed
+        return self.mobject
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        group = self.mobject
+        offsets, fill_opacities, stroke_opacities = self.arrays
+        # manim's rate functions take one float at a time
+        t = np.array([self.instance_rate_func(x) for x in np.clip((alpha - self.starts) / self.instance_time, 0, 1)])
+        faded = 1 - t if self.fade_in else t
+
+        # FadeIn comes in from -shift, FadeOut leaves towards +shift
+        direction = -1 if self.fade_in else 1
+        group.offsets = offsets + np.outer(faded, self.shift_vector * direction)
+        group.instance_fill_rgbas[:, 3] = fill_opacities * (1 - faded)
+        group.instance_stroke_rgbas[:, 3] = stroke_opacities * (1 - faded)
+        group.update_instances()
+
+    def clean_up_from_scene(self, scene) -> None:
+        super().clean_up_from_scene(scene)
+        if self.remover:
+            # like FadeOut, leave the group as it was once it is removed
+            self.interpolate(0)
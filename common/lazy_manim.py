@@ -0,0 +1,263 @@
+"""Import ``manim`` lazily, so a scene module starts without loading all of it.
+
+``import manim`` runs ``manim/__init__.py``, which star-imports every
+animation, mobject, camera, renderer and utility module, scipy and the
+OpenGL stack included, before the first line of a scene file runs. A small
+scene needs a fraction of that.
+
+Once installed, and before anything imports ``manim``, the package module is
+created without running its ``__init__``: ``config``, ``logger`` and the
+rest of ``manim._config`` are loaded right away, every other name is
+resolved by the module ``__getattr__`` on first access, importing only the
+submodule that defines it. Which submodule defines which name is read from
+the ``__all__`` of the modules ``__init__`` star-imports, and kept in
+``media/lazy_manim_index.json`` for the installed manim version.
+
+``from manim import *`` reads every name of ``__all__`` and so still imports
+everything; scene files that import the names they use get the gain. The
+time to reach ``construct``, the manim modules loaded and the slowest names
+to resolve are logged when the scene starts:
+
+    python -m common.lazy_manim 05Config.py TestConfig -q l
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import importlib
+import importlib.util
+import json
+import sys
+import time
+from importlib.metadata import version
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, List, Set, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+INDEX_PATH = ROOT / "media" / "lazy_manim_index.json"
+
+# loaded when installed, everything else in manim reads config and logger at import time
+EAGER_MODULES = ("_config",)
+
+# part of the index key, changed whenever build_index does
+INDEX_VERSION = 2
+
+# name -> (submodule of manim, attribute of it)
+Index = Dict[str, Tuple[str, str]]
+
+_MISSING = object()
+
+
+def _module_path(package: Path, module: str) -> Path:
+    path = package.joinpath(*module.split("."))
+    return path / "__init__.py" if path.is_dir() else path.with_suffix(".py")
+
+
+def _public_names(package: Path, module: str, imported: Set[str] | None = None) -> List[str] | None:
+    """Names ``from module import *`` binds, ``None`` if they cannot be read without importing it.
+
+    Names the module only imports from elsewhere are also added to ``imported``.
+    """
+    path = _module_path(package, module)
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    names = None
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "__all__" for t in node.targets):
+            target = names = []
+        elif isinstance(node, ast.AugAssign) and getattr(node.target, "id", None) == "__all__" and names is not None:
+            target = names
+        else:
+            continue
+        try:
+            target += ast.literal_eval(node.value)
+        except ValueError:
+            return None
+    if names is not None:
+        return names
+
+    # no __all__: every public top level name, as the import system does
+    names = []
+    current = module if path.name == "__init__.py" else module.rpartition(".")[0]
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.append(node.name)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            names += [t.id for t in targets if isinstance(t, ast.Name)]
+        elif isinstance(node, ast.Import):
+            names += [alias.asname or alias.name.partition(".")[0] for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            for alias in node.names:
+                if alias.name != "*":
+                    names.append(alias.asname or alias.name)
+                    if imported is not None:
+                        imported.add(alias.asname or alias.name)
+                    continue
+                if node.level != 1:
+                    return None
+                star = _public_names(package, f"{current}.{node.module}" if node.module else current, imported)
+                if star is None:
+                    return None
+                names += star
+    return [name for name in dict.fromkeys(names) if not name.startswith("_")]
+
+
+def build_index(package: Path) -> Tuple[Index, List[str]]:
+    """Where ``manim/__init__.py`` gets every name from, and the star-imported modules it cannot tell."""
+    index: Index = {}
+    unindexed: List[str] = []
+    # top level only, the IPython magic imported in a try block is registered on install
+    for node in ast.parse((package / "__init__.py").read_text(encoding="utf-8")).body:
+        if not isinstance(node, ast.ImportFrom) or node.level != 1 or node.module in EAGER_MODULES:
+            continue
+        for alias in node.names:
+            if alias.name != "*":
+                index[alias.asname or alias.name] = node.module, alias.name
+                continue
+            imported: Set[str] = set()
+            names = _public_names(package, node.module, imported)
+            if names is None:
+                unindexed.append(node.module)
+            # a later star import shadows an earlier one, as in __init__, unless it only passes the same name on:
+            # scene.section does `from manim import get_video_metadata`, and importing it for that name is circular
+            index.update(
+                (name, (node.module, name)) for name in names or () if name not in index or name not in imported
+            )
+    return index, unindexed
+
+
+class LazyManim:
+    def __init__(self):
+        self.started = time.perf_counter()
+        # name, submodule and seconds of every name resolved on access
+        self.resolved: List[Tuple[str, str, float]] = []
+        self.index: Index = {}
+        self.unindexed: List[str] = []
+        self._installed = False
+
+    def load_index(self, package: Path, manim_version: str) -> None:
+        init = package / "__init__.py"
+        key = f"{manim_version}:{init.stat().st_mtime_ns}:{INDEX_VERSION}"
+        if INDEX_PATH.exists():
+            cached = json.loads(INDEX_PATH.read_text(encoding="utf-8"))
+            if cached["key"] == key:
+                self.index = {name: tuple(entry) for name, entry in cached["index"].items()}
+                self.unindexed = cached["unindexed"]
+                return
+
+        self.index, self.unindexed = build_index(package)
+        INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+        INDEX_PATH.write_text(
+            json.dumps({"key": key, "index": self.index, "unindexed": self.unindexed}),
+            encoding="utf-8"
+        )
+
+    def resolve(self, manim: ModuleType, name: str):
+        start = time.perf_counter()
+        if name in self.index:
+            module, attribute = self.index[name]
+            parent = importlib.import_module(f"manim.{module}")
+            # `from .utils import color` names a submodule, which importing the package may not bind
+            if not hasattr(parent, attribute):
+                importlib.import_module(f"manim.{module}.{attribute}")
+            value = getattr(parent, attribute)
+        else:
+            for module in self.unindexed:
+                value = getattr(importlib.import_module(f"manim.{module}"), name, _MISSING)
+                if value is not _MISSING:
+                    break
+            else:
+                raise AttributeError(f"module 'manim' has no attribute {name!r}")
+
+        manim.__dict__[name] = value
+        self.resolved.append((name, self.index.get(name, ("?",))[0], time.perf_counter() - start))
+        return value
+
+    def install(self) -> None:
+        if self._installed:
+            return
+        self._installed = True
+        if "manim" in sys.modules:
+            # too late, the real package is already there
+            return
+
+        spec = importlib.util.find_spec("manim")
+        manim = importlib.util.module_from_spec(spec)
+        manim.__version__ = version("manim")
+        sys.modules["manim"] = manim
+        self.load_index(Path(spec.origin).parent, manim.__version__)
+
+        import numpy as np
+
+        names = {*self.index, "np"}
+        for module in EAGER_MODULES:
+            eager = importlib.import_module(f"manim.{module}")
+            manim.__dict__.update((name, getattr(eager, name)) for name in eager.__all__)
+            names.update(eager.__all__)
+        manim.np = np
+        manim.__all__ = sorted(names)
+        manim.__getattr__ = lambda name: self.resolve(manim, name)
+
+        # __init__ registers the %%manim magic when run inside IPython
+        if "IPython" in sys.modules:
+            from IPython import get_ipython
+            ipy = get_ipython()
+            if ipy is not None:
+                from manim.utils.ipython_magic import ManimMagic
+                ipy.register_magics(ManimMagic)
+
+    def report(self) -> None:
+        from manim import logger
+
+        loaded = sum(name == "manim" or name.startswith("manim.") for name in sys.modules)
+        slowest = sorted(self.resolved, key=lambda entry: -entry[2])[:5]
+        logger.info(
+            f"Startup: construct reached after {time.perf_counter() - self.started:.2f}s, "
+            f"{loaded} manim modules loaded, {len(self.resolved)} of {len(self.index)} names resolved; slowest "
+            + ", ".join(f"{name} ({module}) {seconds * 1000:.0f}ms" for name, module, seconds in slowest)
+        )
+
+
+lazy_manim = LazyManim()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", default=None, help="l, m, h, p or k")
+    parser.add_argument("--renderer", default=None)
+    args = parser.parse_args()
+
+    lazy_manim.install()
+
+    # manim alone: common.render brings in the rendering hooks of this repo, and every manim name they use
+    from manim import Scene, config, tempconfig
+    from manim.constants import QUALITIES
+    from manim.utils.module_ops import get_module, get_scene_classes_from_module
+
+    render = Scene.render
+
+    def reported_render(scene: Scene, preview: bool = False):
+        construct = scene.construct
+
+        def reported_construct():
+            lazy_manim.report()
+            return construct()
+
+        scene.construct = reported_construct
+        return render(scene, preview)
+
+    Scene.render = reported_render
+    with tempconfig({"input_file": args.file, "preview": False}):
+        if args.quality is not None:
+            config.quality = next((name for name, q in QUALITIES.items() if q["flag"] == args.quality), args.quality)
+        if args.renderer is not None:
+            config.renderer = args.renderer
+        scenes = {cls.__name__: cls for cls in get_scene_classes_from_module(get_module(Path(args.file)))}
+        scenes[args.scene]().render()
+
+
+if __name__ == "__main__":
+    main()
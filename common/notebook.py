@@ -0,0 +1,142 @@
+"""Notebook cell magic that shows a quick preview, then the full render.
+
+manim's ``%%manim`` renders the scene of the cell from scratch at the
+requested quality every time the cell runs, and with ``manim.cfg`` turning
+caching off, a colour tweak costs as much as the first run. ``%%manim_live``
+keeps what the kernel already has:
+
+* partial movie files stay cached and are named after the content hash of
+  each animation (``common.scene_hash``), so only the animations whose
+  mobjects or arguments changed are rendered again,
+* the Tex cache lives on disk and the Text cache in the kernel, across runs,
+* the scene is first rendered at preview quality and shown right away; the
+  full quality render follows in a background thread and replaces the
+  preview in the cell output when it is done.
+
+Running the cell again cancels a full render that has not finished, at its
+next ``play``; the animations it finished stay cached.
+
+    %load_ext common.notebook
+
+    %%manim_live -qm FirstExample
+    class FirstExample(Scene):
+        ...
+"""
+from __future__ import annotations
+
+import argparse
+import shlex
+import shutil
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Type
+
+from IPython.core.magic import Magics, cell_magic, magics_class
+from IPython.display import Image, Video, display
+from manim import Scene, config, logger
+
+from common.render import render_config
+from common.tex_cache import tex_cache
+from common.text_cache import text_cache
+
+
+class RenderCancelled(Exception):
+    pass
+
+
+def render_cell_scene(
+        scene_class: Type[Scene],
+        quality: str,
+        renderer: str | None = None,
+        cancel: threading.Event | None = None
+) -> Path | None:
+    """Render ``scene_class`` with the partial movie cache kept, and return the movie or image written."""
+    with render_config(quality, renderer, disable_caching=False, flush_cache=False, preview=False):
+        scene = scene_class()
+        if cancel is not None:
+            play = scene.play
+
+            def cancellable_play(*args, **kwargs):
+                if cancel.is_set():
+                    raise RenderCancelled(scene_class.__name__)
+                return play(*args, **kwargs)
+
+            # wait() goes through play() too
+            scene.play = cancellable_play
+        scene.render()
+        return Path(config.output_file) if config.output_file else None
+
+
+def display_object(output: Path):
+    if output.suffix == ".png":
+        return Image(filename=str(output))
+
+    # a new name every time, or the browser shows the video it already has
+    copy = Path(config.media_dir) / "jupyter" / f"{output.stem}@{datetime.now():%Y-%m-%d@%H-%M-%S-%f}{output.suffix}"
+    copy.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy(output, copy)
+    return Video(
+        copy,
+        html_attributes=f'controls autoplay loop style="max-width: {config.media_width};"',
+        embed=bool(config.media_embed),
+    )
+
+
+@magics_class
+class LiveMagics(Magics):
+    def __init__(self, shell):
+        super().__init__(shell)
+        self._cancel = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def cancel(self) -> None:
+        """Stop the full render still running, so the next one has ``config`` to itself."""
+        if self._thread is not None and self._thread.is_alive():
+            self._cancel.set()
+            self._thread.join()
+
+    @cell_magic
+    def manim_live(self, line: str, cell: str) -> None:
+        parser = argparse.ArgumentParser(prog="%%manim_live")
+        parser.add_argument("scene")
+        parser.add_argument("-q", "--quality", default="m", help="l, m, h, p or k")
+        parser.add_argument("--preview", default="l", help="quality shown first, 'none' for no preview")
+        parser.add_argument("--renderer", default=None)
+        args = parser.parse_args(shlex.split(line))
+
+        self.cancel()
+        tex_cache.install()
+        text_cache.install()
+
+        exec(cell, self.shell.user_ns)
+        scene_class = self.shell.user_ns[args.scene]
+
+        handle = None
+        if args.preview not in ("none", args.quality):
+            output = render_cell_scene(scene_class, args.preview, args.renderer)
+            if output is not None:
+                handle = display(display_object(output), display_id=True)
+
+        if handle is None:
+            output = render_cell_scene(scene_class, args.quality, args.renderer)
+            if output is not None:
+                display(display_object(output))
+            return
+
+        def render_in_background(cancel: threading.Event):
+            try:
+                output = render_cell_scene(scene_class, args.quality, args.renderer, cancel)
+            except RenderCancelled:
+                logger.info(f"Full render of {args.scene} cancelled")
+                return
+            if output is not None:
+                handle.update(display_object(output))
+
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=render_in_background, args=(self._cancel,), daemon=True)
+        self._thread.start()
+
+
+def load_ipython_extension(ipython) -> None:
+    ipython.register_magics(LiveMagics)
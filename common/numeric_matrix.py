@@ -0,0 +1,240 @@
+"""``Matrix`` of numbers laid out from a precomputed glyph atlas.
+
+``Matrix`` turns every entry into its own ``MathTex``, i.e. one LaTeX run and
+one SVG parse per cell. ``NumericMatrix`` typesets the characters of numbers
+once, then builds all entries by copying glyph outlines and positions them in
+one batch with NumPy. Entries containing other characters (``-inf``, ``nan``,
+``1e-05``) still fall back to ``MathTex``.
+
+``SetValues`` changes the numbers of a matrix already on screen: only the cells
+whose printed value differs are rebuilt and morphed, brackets and unchanged
+cells keep their glyphs.
+
+    from common.numeric_matrix import NumericMatrix, SetValues
+    matrix = NumericMatrix(np.random.random((6, 5)).round(2))
+    self.play(SetValues(matrix, (matrix.values * 2).round(2)))
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+from manim import (
+    DEFAULT_FONT_SIZE, DOWN, ORIGIN, RIGHT, Animation, MathTex, Matrix, Mobject, Transform, VGroup, VMobject, config,
+    linear
+)
+
+
+class GlyphAtlas:
+    _atlases: Dict[Tuple[str, float, str], GlyphAtlas] = {}
+
+    def __init__(self, chars: str = "-0123456789.", font_size: float = DEFAULT_FONT_SIZE, reference: str = "0"):
+        # the ink-left edges of neighbours are apart by the advance of the first
+        # glyph plus the side bearing of the second, so every character is
+        # typeset between two references, "0 0 c 0 d 0 ...", to tell the two
+        # apart; "{-}" keeps the minus unary, as at the start of a number
+        line = [reference, reference]
+        for char in chars:
+            line += ["{-}" if char == "-" else char, reference]
+        tex = MathTex(*line, font_size=font_size)
+        lefts = [part.get_left()[0] for part in tex]
+        reference_advance = lefts[1] - lefts[0]
+
+        self.chars = chars
+        self.glyphs: Dict[str, List[np.ndarray]] = {}
+        self.advances: Dict[str, float] = {}
+        for i, char in enumerate(chars):
+            j = 2 * i + 2
+            # side bearing relative to the reference's, which shifts every glyph alike
+            bearing = lefts[j] - lefts[j - 1] - reference_advance
+            self.glyphs[char] = [
+                glyph.points - [lefts[j] - bearing, 0, 0] for glyph in tex[j].family_members_with_points()
+            ]
+            self.advances[char] = lefts[j + 1] - lefts[j] + bearing
+
+    @classmethod
+    def get(cls, font_size: float = DEFAULT_FONT_SIZE) -> GlyphAtlas:
+        key = ("-0123456789.", font_size, str(config.renderer))
+        if key not in cls._atlases:
+            cls._atlases[key] = GlyphAtlas(key[0], font_size)
+        return cls._atlases[key]
+
+    def can_typeset(self, string: str) -> bool:
+        return all(char in self.glyphs for char in string)
+
+    def typeset(self, strings: Sequence[str], anchors: np.ndarray, corner: np.ndarray) -> List[VGroup]:
+        """Build one ``VGroup`` of glyphs per string, its ``corner`` placed at the matching anchor."""
+        if not strings:
+            return []
+
+        glyph_points = []
+        owners = []
+        for entry, string in enumerate(strings):
+            x = 0.0
+            for char in string:
+                for points in self.glyphs[char]:
+                    glyph_points.append(points + [x, 0, 0])
+                    owners.append(entry)
+                x += self.advances[char]
+
+        sizes = np.array([len(points) for points in glyph_points])
+        all_points = np.concatenate(glyph_points)
+        point_owners = np.repeat(owners, sizes)
+
+        mins = np.full((len(strings), 3), np.inf)
+        maxs = np.full((len(strings), 3), -np.inf)
+        np.minimum.at(mins, point_owners, all_points)
+        np.maximum.at(maxs, point_owners, all_points)
+        corners = (mins + maxs) / 2 + corner * (maxs - mins) / 2
+        all_points += (anchors - corners)[point_owners]
+
+        entries = [VGroup() for _ in strings]
+        for owner, points in zip(owners, np.split(all_points, np.cumsum(sizes)[:-1])):
+            glyph = VMobject(fill_opacity=1, stroke_width=0)
+            glyph.set_points(points)
+            entries[owner].add(glyph)
+        return entries
+
+
+class NumericMatrix(Matrix):
+    def __init__(self, matrix, font_size: float = DEFAULT_FONT_SIZE, **kwargs):
+        self.atlas = GlyphAtlas.get(font_size)
+        self.values = np.array(matrix)
+        # points of every entry as laid out, before the matrix is moved around
+        self._layouts: List[np.ndarray] = []
+        super().__init__(self.values, **kwargs)
+
+    @staticmethod
+    def _entry_points(entry: VMobject) -> np.ndarray:
+        return np.concatenate([mob.points for mob in entry.family_members_with_points()])
+
+    def get_anchors(self, shape: Tuple[int, int]) -> np.ndarray:
+        rows, cols = np.indices(shape)
+        return (rows[..., None] * self.v_buff * DOWN + cols[..., None] * self.h_buff * RIGHT).reshape(-1, 3)
+
+    def _typeset(self, strings: Sequence[str], anchors: np.ndarray) -> List[VMobject]:
+        corner = np.array(self.element_alignment_corner)
+        typeset = [i for i, string in enumerate(strings) if self.atlas.can_typeset(string)]
+        entries = dict(zip(typeset, self.atlas.typeset([strings[i] for i in typeset], anchors[typeset], corner)))
+        for i, string in enumerate(strings):
+            if i not in entries:
+                entries[i] = MathTex(string).move_to(anchors[i], corner)
+        return [entries[i] for i in range(len(strings))]
+
+    def _matrix_to_mob_matrix(self, matrix):
+        entries = self._typeset([str(item) for item in np.ravel(matrix)], self.get_anchors(np.shape(matrix)))
+        self._layouts = [self._entry_points(entry) for entry in entries]
+
+        cols = np.shape(matrix)[1]
+        return [[entries[i * cols + j] for j in range(cols)] for i in range(len(matrix))]
+
+    def _organize_mob_matrix(self, matrix):
+        # entries are already placed by _matrix_to_mob_matrix
+        return self
+
+    def get_pose(self) -> np.ndarray:
+        """Affine map from layout coordinates to where the entries are now, as a 3x3 array.
+
+        Rows are the images of the layout x and y axes and of the layout origin,
+        so ``[x, y, 1] @ pose`` places a layout point.
+        """
+        layout, current = [], []
+        for entry, points in zip(self.elements, self._layouts):
+            entry_points = self._entry_points(entry)
+            # entries reshaped by a Transform no longer match their layout
+            if len(entry_points) == len(points):
+                layout.append(points)
+                current.append(entry_points)
+        if not layout:
+            raise ValueError("the entries of this NumericMatrix were transformed, its layout is lost")
+
+        layout = np.concatenate(layout)
+        layout = np.column_stack([layout[:, :2], np.ones(len(layout))])
+        pose, *_ = np.linalg.lstsq(layout, np.concatenate(current), rcond=None)
+        return pose
+
+    def build_entries(self, values: np.ndarray) -> Tuple[List[int], List[VMobject], List[np.ndarray]]:
+        """Build the entries whose printed value changes, placed and styled like the ones they replace.
+
+        Returns the flat indices of the changed cells, their new entries and the
+        layout points of those entries.
+        """
+        if values.shape != self.values.shape:
+            raise ValueError(f"expected a matrix of shape {self.values.shape}, got {values.shape}")
+
+        strings = [str(item) for item in values.ravel()]
+        changed = [i for i, (old, new) in enumerate(zip(self.values.ravel(), strings)) if str(old) != new]
+        if not changed:
+            return [], [], []
+
+        entries = self._typeset([strings[i] for i in changed], self.get_anchors(values.shape)[changed])
+        layouts = [self._entry_points(entry) for entry in entries]
+        pose = self.get_pose()
+        for i, entry in zip(changed, entries):
+            for mob in entry.family_members_with_points():
+                mob.set_points(np.column_stack([mob.points[:, :2], np.ones(len(mob.points))]) @ pose)
+            entry.match_style(self.elements[i])
+        return changed, entries, layouts
+
+    def replace_entries(
+            self, indices: Sequence[int], entries: Sequence[VMobject], layouts: Sequence[np.ndarray], values: np.ndarray
+    ) -> None:
+        cols = self.values.shape[1]
+        for i, entry, layout in zip(indices, entries, layouts):
+            if hasattr(self.elements, "replace_submobject"):
+                self.elements.replace_submobject(i, entry)
+            else:
+                self.elements.submobjects[i] = entry
+            self.mob_matrix[i // cols][i % cols] = entry
+            self._layouts[i] = layout
+        self.values = values
+
+    def set_values(self, values) -> NumericMatrix:
+        """Change the numbers in place, without animation."""
+        values = np.array(values)
+        self.replace_entries(*self.build_entries(values), values)
+        return self
+
+
+class SetValues(Animation):
+    """Morph the cells of a ``NumericMatrix`` whose printed value changes into the new values.
+
+    Unchanged cells and the brackets are left alone; ``shift`` moves the whole
+    matrix by that much over the course of the animation.
+    """
+
+    def __init__(self, matrix: NumericMatrix, values, shift: np.ndarray = ORIGIN, **kwargs):
+        self.values = np.array(values)
+        self.shift = np.array(shift, dtype=float)
+        self.offset = np.zeros(3)
+        self.changed: List[int] = []
+        self.entries: List[VMobject] = []
+        self.layouts: List[np.ndarray] = []
+        self.transforms: List[Transform] = []
+        super().__init__(matrix, **kwargs)
+
+    def begin(self) -> None:
+        # built only now, the matrix may have been moved by the animations before this one
+        self.changed, self.entries, self.layouts = self.mobject.build_entries(self.values)
+        self.transforms = [
+            Transform(self.mobject.elements[i], entry.shift(self.shift), rate_func=linear)
+            for i, entry in zip(self.changed, self.entries)
+        ]
+        for transform in self.transforms:
+            transform.begin()
+        super().begin()
+
+    def create_starting_mobject(self) -> Mobject:
+        # the changed cells keep their own starting copies
+        return self.mobject
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        if self.shift.any():
+            self.mobject.shift(alpha * self.shift - self.offset)
+            self.offset = alpha * self.shift
+        for transform in self.transforms:
+            transform.interpolate(alpha)
+
+    def finish(self) -> None:
+        super().finish()
+        self.mobject.replace_entries(self.changed, self.entries, self.layouts, self.values)
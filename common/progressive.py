@@ -0,0 +1,146 @@
+"""Render a low resolution preview of a scene first, the full quality after.
+
+``manim.cfg`` renders everything at 1080p60, a quick look at
+``Square2Circle`` included. Here the scene is rendered at preview quality
+(480p15 by default) and copied to a fixed path under ``media/progressive``,
+which the CLI returns with. A background process then renders the full
+quality and swaps it in with ``os.replace``, so a player showing the file
+never reads half of it.
+
+Both renders keep manim's partial movie cache and share the Tex cache on
+disk: LaTeX runs once, for the preview, and running the command again after
+a tweak renders only the animations that changed, at both qualities, under
+either renderer (``common.scene_hash`` hashes them the same way in every
+process). When a scene is rendered again before its last full render
+finished, only the newest full render is swapped in: every run takes over
+the ``.latest`` marker before its preview and hands its token to its full
+render.
+
+    python -m common.progressive 03Animations.py Square2Circle -p
+    python -m common.progressive 03Animations.py Square2Circle -q h --preview-quality l
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import uuid
+from pathlib import Path
+
+from manim import logger
+from manim.utils.file_ops import open_file
+
+from common.render import ROOT, render_scene
+from common.tex_cache import tex_cache
+
+PREVIEW_QUALITY = "l"
+
+
+def progressive_path(file: str | Path, scene_name: str) -> Path:
+    """Where the preview, then the full render, of a scene is found, without extension."""
+    return ROOT / "media" / "progressive" / Path(file).stem / scene_name
+
+
+def render_cached(file: str | Path, scene_name: str, quality: str | None, renderer: str | None) -> Path | None:
+    tex_cache.install()
+    movie = render_scene(
+        file,
+        scene_name,
+        quality,
+        renderer,
+        disable_caching=False,
+        flush_cache=False,
+        preview=False
+    )
+    # a scene without animations only saves its last frame
+    return movie if movie is not None and movie.exists() else None
+
+
+def swap_in(movie: Path, target: Path) -> Path:
+    target = target.with_suffix(movie.suffix)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # copied next to the target first, os.replace is atomic within a directory only
+    temporary = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    shutil.copyfile(movie, temporary)
+    os.replace(temporary, target)
+    return target
+
+
+def render_full(
+        file: str | Path,
+        scene_name: str,
+        quality: str | None,
+        renderer: str | None,
+        token: str
+) -> Path | None:
+    """Render the full quality and swap it in, unless a newer run has taken ``.latest`` over from ``token``."""
+    target = progressive_path(file, scene_name)
+    movie = render_cached(file, scene_name, quality, renderer)
+    if movie is None:
+        return None
+    if target.with_suffix(".latest").read_text(encoding="utf-8") != token:
+        logger.info(f"{scene_name} was rendered again meanwhile, its full render is left out")
+        return None
+    target = swap_in(movie, target)
+    logger.info(f"Full quality {scene_name} swapped in at {target}")
+    return target
+
+
+def render_progressive(
+        file: str | Path,
+        scene_name: str,
+        quality: str | None = None,
+        renderer: str | None = None,
+        preview_quality: str = PREVIEW_QUALITY
+) -> Path | None:
+    """Render the preview, start the full render in the background and return the path both end up at."""
+    target = progressive_path(file, scene_name)
+    # taken before the preview, so a full render of an earlier run still going cannot swap in over it
+    token = uuid.uuid4().hex
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.with_suffix(".latest").write_text(token, encoding="utf-8")
+
+    movie = render_cached(file, scene_name, preview_quality, renderer)
+    if movie is None:
+        logger.info(f"{scene_name} has no animations, nothing to preview")
+        return None
+    target = swap_in(movie, target)
+    logger.info(f"Preview of {scene_name} at {target}")
+
+    command = [sys.executable, "-m", "common.progressive", str(file), scene_name, "--full", token]
+    if quality is not None:
+        command += ["-q", quality]
+    if renderer is not None:
+        command += ["--renderer", renderer]
+    with target.with_suffix(".log").open("w", encoding="utf-8") as log:
+        # outlives this process, and a Ctrl+C in the terminal
+        subprocess.Popen(command, cwd=ROOT, stdout=log, stderr=subprocess.STDOUT, start_new_session=True)
+    logger.info(f"Full quality render running in the background, logging to {target.with_suffix('.log')}")
+    return target
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", default=None, help="l, m, h, p or k, of the full render")
+    parser.add_argument("--preview-quality", default=PREVIEW_QUALITY)
+    parser.add_argument("--renderer", default=None)
+    parser.add_argument("-p", "--open", action="store_true", help="open the preview when it is ready")
+    parser.add_argument("--full", metavar="TOKEN", default=None, help="only render the full quality and swap it in")
+    args = parser.parse_args()
+
+    file = Path(args.file).resolve()
+    if args.full is not None:
+        render_full(file, args.scene, args.quality, args.renderer, args.full)
+        return
+
+    target = render_progressive(file, args.scene, args.quality, args.renderer, args.preview_quality)
+    if target is not None and args.open:
+        open_file(target)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Helpers for rendering scenes of this repo from Python instead of the manim CLI."""
+from __future__ import annotations
+
+import subprocess
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, NamedTuple, Type
+
+import numpy as np
+from manim import QUALITIES, RendererType, Scene, config, logger, tempconfig
+from manim.utils.module_ops import get_module, get_scene_classes_from_module
+
+from common.background_layer import background_layer
+from common.dirty_rects import dirty_rects
+from common.frame_writer import frame_writer
+from common.scene_hash import scene_hasher
+from common.static_frames import static_frames
+
+ROOT = Path(__file__).resolve().parent.parent
+
+QUALITY_FLAGS = {q["flag"]: name for name, q in QUALITIES.items() if q["flag"]}
+
+
+class LoadedModule(NamedTuple):
+    mtime: int
+    scenes: dict[str, Type[Scene]]
+    # what running the module did to config, applied again whenever it is reused
+    config_changes: Dict[str, Any]
+
+
+_modules: Dict[Path, LoadedModule] = {}
+
+
+def _changed(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Any]:
+    changes = {}
+    for key, value in after.items():
+        old = before.get(key)
+        if isinstance(value, np.ndarray) or isinstance(old, np.ndarray):
+            same = np.array_equal(old, value)
+        else:
+            same = old == value
+        if not same:
+            changes[key] = value
+    return changes
+
+
+def load_scenes(file: str | Path) -> dict[str, Type[Scene]]:
+    """Scene classes of ``file``, which is run again only if it changed since it was last loaded."""
+    path = Path(file).resolve()
+    mtime = path.stat().st_mtime_ns
+    loaded = _modules.get(path)
+    if loaded is not None and loaded.mtime == mtime:
+        config._d.update(loaded.config_changes)
+        return loaded.scenes
+
+    before = config.copy()._d
+    module = get_module(Path(file))
+    scenes = {cls.__name__: cls for cls in get_scene_classes_from_module(module)}
+    _modules[path] = LoadedModule(mtime, scenes, _changed(before, config._d))
+    return scenes
+
+
+def load_scene(file: str | Path, scene_name: str) -> Type[Scene]:
+    scenes = load_scenes(file)
+    if scene_name not in scenes:
+        raise KeyError(f"{scene_name} is not in {file}")
+    return scenes[scene_name]
+
+
+@contextmanager
+def render_config(quality: str | None = None, renderer: str | None = None, **options) -> Iterator[None]:
+    """Install the rendering hooks of this repo and set up ``config`` for one render.
+
+    ``quality`` accepts the CLI flags (``l``, ``m``, ``h``, ``p``, ``k``) and
+    ``options`` are applied to ``config`` until the block exits.
+    """
+    frame_writer.install()
+    scene_hasher.install()
+    static_frames.install()
+    with tempconfig(options):
+        if quality is not None:
+            config.quality = QUALITY_FLAGS.get(quality, quality)
+        if renderer is not None:
+            config.renderer = renderer
+        # they patch the cairo renderer only
+        if config.renderer == RendererType.CAIRO:
+            background_layer.install()
+            dirty_rects.install()
+        yield
+
+
+def render_scene(
+        file: str | Path,
+        scene_name: str,
+        quality: str | None = None,
+        renderer: str | None = None,
+        **options
+) -> Path | None:
+    """Render one scene of ``file`` and return the written movie file, if any.
+
+    ``quality``, ``renderer`` and ``options`` are those of ``render_config``.
+    """
+    with render_config(quality, renderer, input_file=str(file), **options):
+        scene = load_scene(file, scene_name)()
+        scene.render()
+
+        return getattr(scene.renderer.file_writer, "movie_file_path", None)
+
+
+def concat_movies(files: list[Path], output: Path) -> Path:
+    """Join movie files with ffmpeg's concat demuxer, without re-encoding."""
+    file_list = output.with_name(f"{output.stem}_file_list.txt")
+    with file_list.open("w", encoding="utf-8") as fp:
+        for file in files:
+            fp.write(f"file 'file:{Path(file).as_posix()}'\n")
+
+    subprocess.run([
+        config.ffmpeg_executable,
+        "-y",
+        "-f", "concat",
+        "-safe", "0",
+        "-i", str(file_list),
+        "-loglevel", config.ffmpeg_loglevel.lower(),
+        "-nostdin",
+        "-c", "copy",
+        str(output)
+    ], check=True)
+    file_list.unlink()
+
+    logger.info(f"Combined {len(files)} movie files into {output}")
+    return output
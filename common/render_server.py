@@ -0,0 +1,167 @@
+"""A long lived render process, fed jobs over a local socket.
+
+Every ``manim`` run starts a new interpreter, imports manim, loads the
+fonts, sets up the LaTeX template and, with the OpenGL renderer, compiles
+the shaders again, before the first frame of a scene that is being tweaked
+for the tenth time. The server does all that once and renders one job after
+the other:
+
+* a scene file is run again only when it changed on disk
+  (``common.render.load_scenes``),
+* the Tex and Text caches stay in memory, with Pango's fonts,
+* the OpenGL context, and the shader programs manim keeps per context, is
+  handed from one job to the next when rendering without a window.
+
+Jobs are one line of JSON each way over a TCP socket on localhost:
+
+    python -m common.render_server serve
+    python -m common.render_server render LLM/01transformer.py AttentionLayer -q l
+    python -m common.render_server stop
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import socket
+import socketserver
+import sys
+import time
+import traceback
+from pathlib import Path
+
+# the client only sends a line of JSON, manim is imported by the server alone
+ADDRESS = ("127.0.0.1", 8765)
+
+
+class RenderServer:
+    def __init__(self, address=ADDRESS):
+        self.address = address
+        self.jobs = 0
+        self.running = False
+        # context and frame buffer of the last windowless OpenGL render
+        self._context = None
+        self._frame_buffer_object = None
+        self._installed = False
+
+    def install(self) -> None:
+        if self._installed:
+            return
+        self._installed = True
+
+        from manim.renderer.opengl_renderer import OpenGLRenderer
+
+        from common.tex_cache import tex_cache
+        from common.text_cache import text_cache
+
+        tex_cache.install()
+        text_cache.install()
+
+        init_scene = OpenGLRenderer.init_scene
+
+        def warm_init_scene(renderer: OpenGLRenderer, scene):
+            if self._context is not None and not renderer.should_create_window():
+                # init_scene only creates a context for renderers without one; the frame buffer follows the quality
+                self._frame_buffer_object.release()
+                renderer.window = None
+                renderer.context = self._context
+                renderer.frame_buffer_object = renderer.get_frame_buffer_object(self._context, 0)
+                # init_scene binds the frame buffer only along with a new context
+                renderer.frame_buffer_object.use()
+            init_scene(renderer, scene)
+            if renderer.window is None:
+                self._context = renderer.context
+                self._frame_buffer_object = renderer.frame_buffer_object
+
+        OpenGLRenderer.init_scene = warm_init_scene
+
+    def run(self, job: dict) -> dict:
+        from manim import logger
+
+        from common.render import render_scene
+
+        start = time.perf_counter()
+        try:
+            movie = render_scene(
+                job["file"],
+                job["scene"],
+                job.get("quality"),
+                job.get("renderer"),
+                preview=False
+            )
+        except Exception:
+            logger.error(f"{job['file']}::{job['scene']} failed")
+            return {"ok": False, "error": traceback.format_exc()}
+        finally:
+            self.jobs += 1
+        return {"ok": True, "movie": str(movie) if movie else None, "seconds": time.perf_counter() - start}
+
+    def serve(self) -> None:
+        from manim import logger
+
+        self.install()
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                job = json.loads(self.rfile.readline())
+                if job.get("stop"):
+                    server.running = False
+                    reply = {"ok": True, "jobs": server.jobs}
+                else:
+                    logger.info(f"Job {server.jobs + 1}: {job['file']}::{job['scene']}")
+                    reply = server.run(job)
+                self.wfile.write(json.dumps(reply).encode() + b"\n")
+
+        # manim's config is global, jobs run one at a time
+        with socketserver.TCPServer(self.address, Handler) as tcp:
+            logger.info(f"Render server listening on {self.address[0]}:{self.address[1]}")
+            self.running = True
+            while self.running:
+                tcp.handle_request()
+
+
+def send(job: dict, address=ADDRESS) -> dict:
+    with socket.create_connection(address) as connection:
+        connection.sendall(json.dumps(job).encode() + b"\n")
+        with connection.makefile("rb") as reply:
+            return json.loads(reply.readline())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=ADDRESS[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("serve")
+    commands.add_parser("stop")
+    render = commands.add_parser("render")
+    render.add_argument("file")
+    render.add_argument("scene")
+    render.add_argument("-q", "--quality", default=None, help="l, m, h, p or k")
+    render.add_argument("--renderer", default=None)
+    args = parser.parse_args()
+
+    address = ADDRESS[0], args.port
+    if args.command == "serve":
+        RenderServer(address).serve()
+        return
+
+    if args.command == "stop":
+        reply = send({"stop": True}, address)
+        print(f"Render server stopped after {reply['jobs']} jobs")
+        return
+
+    reply = send({
+        # the server may run from another directory
+        "file": str(Path(args.file).resolve()),
+        "scene": args.scene,
+        "quality": args.quality,
+        "renderer": args.renderer,
+    }, address)
+    if not reply["ok"]:
+        print(reply["error"], file=sys.stderr)
+        sys.exit(1)
+    print(f"Rendered {reply['movie']} in {reply['seconds']:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Render a scene so that a rerun starts at the first animation that changed.
+
+``manim.cfg`` turns caching off and flushes the partial movie files after
+every render, so a crash or a tweak late in a long scene means rendering it
+again from the start. A resumable render keeps manim's content hashes on
+(scene state plus animation arguments, see ``common.scene_hash``) and keeps
+the partial movie files. It also records every partial movie file once
+ffmpeg has finished writing it. On a rerun, animations whose hash is
+recorded are skipped without rendering, so the render picks up at the first
+one that changed.
+
+Only files recorded as finished are reused. A file left half written by a
+crash is rendered again.
+
+    python -m common.resume LLM/01transformer.py DecoderOnly -q h
+    python -m common.resume LLM/01transformer.py DecoderOnly -q h --restart
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+
+from manim import logger
+from manim.scene.scene_file_writer import SceneFileWriter
+
+from common.render import render_scene
+
+
+class ResumableRender:
+    def __init__(self, restart: bool = False):
+        # forget what earlier renders finished
+        self.restart = restart
+        self.reused = 0
+        self.rendered = 0
+        self._installed = False
+
+    @staticmethod
+    def manifest_path(writer: SceneFileWriter) -> Path:
+        # next to the partial movie directory, whose oldest files manim deletes past max_files_cached
+        directory = Path(writer.partial_movie_directory)
+        return directory.with_name(f"{directory.name}.resume.json")
+
+    def finished(self, writer: SceneFileWriter) -> dict[str, int]:
+        """Hashes of the partial movie files ffmpeg finished writing, with their animation index."""
+        if "resume_finished" not in writer.__dict__:
+            path = self.manifest_path(writer)
+            fresh = self.restart or not path.exists()
+            writer.resume_finished = {} if fresh else json.loads(path.read_text(encoding="utf-8"))
+        return writer.resume_finished
+
+    def record(self, writer: SceneFileWriter, hash_invocation: str) -> None:
+        finished = self.finished(writer)
+        finished[hash_invocation] = writer.renderer.num_plays
+
+        path = self.manifest_path(writer)
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(finished, indent=2), encoding="utf-8")
+        os.replace(temporary, path)
+
+    def install(self) -> None:
+        if self._installed:
+            return
+        self._installed = True
+
+        is_already_cached = SceneFileWriter.is_already_cached
+        close_movie_pipe = SceneFileWriter.close_movie_pipe
+
+        def is_finished(writer: SceneFileWriter, hash_invocation: str) -> bool:
+            if hash_invocation in self.finished(writer) and is_already_cached(writer, hash_invocation):
+                self.reused += 1
+                return True
+            if not self.rendered:
+                logger.info(f"Resuming at animation {writer.renderer.num_plays}")
+            self.rendered += 1
+            return False
+
+        def close_and_record(writer: SceneFileWriter):
+            close_movie_pipe(writer)
+            self.record(writer, Path(writer.partial_movie_file_path).stem)
+
+        SceneFileWriter.is_already_cached = is_finished
+        SceneFileWriter.close_movie_pipe = close_and_record
+
+
+resumable_render = ResumableRender()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", default=None, help="l, m, h, p or k")
+    parser.add_argument("--renderer", default=None)
+    parser.add_argument("--restart", action="store_true", help="forget the finished animations first")
+    args = parser.parse_args()
+
+    resumable_render.restart = args.restart
+    resumable_render.install()
+
+    render_scene(
+        args.file,
+        args.scene,
+        args.quality,
+        args.renderer,
+        disable_caching=False,
+        flush_cache=False,
+        # every animation of the longest scene has to stay on disk
+        max_files_cached=100_000,
+        preview=False
+    )
+    logger.info(f"{resumable_render.reused} animations reused, {resumable_render.rendered} rendered")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""Content hashes of ``play`` calls, built from per-mobject hashes.
+
+manim names cached partial movie files after a hash of the camera, the
+animations and every mobject of the scene, which it gets by serializing all
+of them to JSON: every attribute of every submobject, for every ``play``.
+``DecoderOnly`` keeps hundreds of glyphs, prisms and matrices on screen, and
+a group holding them is serialized again wherever it is referenced.
+
+Here a mobject's hash combines a digest of its own attributes, arrays hashed
+as raw bytes, with the hashes of its submobjects, Merkle style. Every
+mobject is hashed once per ``play`` however many groups or animations refer
+to it, and the play hash combines the hashes of the top level mobjects.
+Code objects are immutable and their digests are kept across calls.
+
+manim mobjects carry no dirty flag and change their arrays in place, so
+mobject hashes are recomputed for every ``play``, from bytes rather than
+JSON.
+
+    from common.scene_hash import scene_hasher
+    scene_hasher.install()
+
+A cached animation is skipped by jumping straight to its end. Under OpenGL,
+``DrawBorderThenFill`` and ``Write`` only give their submobjects the points
+of the outline on the frames of its first half, and fail when those are
+skipped; once installed, the outline is copied over first when they are.
+
+The hashes have to come out the same in every process, or no rerun finds its
+cached animations. ``--check`` renders a scene in two processes and compares
+their play hashes:
+
+    python -m common.scene_hash 03Animations.py Square2Circle -q l --check
+"""
+from __future__ import annotations
+
+import argparse
+import atexit
+import hashlib
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import BuiltinFunctionType, CodeType, FunctionType, MethodType, ModuleType
+from typing import Any, Dict, Iterable, List
+
+import numpy as np
+from manim import Animation, DrawBorderThenFill, Mobject, Scene, logger
+from manim.utils import hashing
+
+# caches the renderers and this repo keep on objects, not part of what is drawn
+SKIPPED_ATTRIBUTES = {
+    "submobjects", "parents", "family", "pixel_array", "background", "pixel_array_to_cairo_context",
+    "static_image", "renderer", "scene",
+    # OpenGL shader wrappers, whose ids come from hash(str) and change from one process to the next,
+    # and the triangulation the OpenGL renderer computes when it first draws a mobject
+    "shader_wrapper", "fill_shader_wrapper", "stroke_shader_wrapper", "triangulation",
+}
+
+
+class SceneHasher:
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.objects = 0
+        # every play hash computed, in order
+        self.hashes: List[str] = []
+        self._code: Dict[CodeType, bytes] = {}
+        # per call: digest of every object seen, by id; the objects are kept alive meanwhile
+        self._memo: Dict[int, bytes] = {}
+        self._alive: List[Any] = []
+        self._installed = False
+
+    def digest(self, value: Any) -> bytes:
+        if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+            return f"{type(value).__name__}:{value!r}".encode()
+        if isinstance(value, np.generic):
+            return value.tobytes()
+        if isinstance(value, ModuleType):
+            return f"module:{value.__name__}".encode()
+        if isinstance(value, type):
+            return f"type:{value.__module__}.{value.__qualname__}".encode()
+        if isinstance(value, Scene):
+            return b"scene"
+        if isinstance(value, CodeType):
+            return self.code_digest(value)
+
+        key = id(value)
+        if key in self._memo:
+            return self._memo[key]
+        # a reference back to an object being hashed
+        self._memo[key] = b"cycle"
+        self._alive.append(value)
+        self.objects += 1
+
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{type(value).__module__}.{type(value).__qualname__}".encode())
+        for part in self.parts(value):
+            h.update(part)
+        self._memo[key] = h.digest()
+        return self._memo[key]
+
+    def parts(self, value: Any) -> Iterable[bytes]:
+        if isinstance(value, np.ndarray):
+            yield f"{value.dtype}{value.shape}".encode()
+            if value.dtype == object:
+                yield from map(self.digest, value.ravel())
+            else:
+                yield np.ascontiguousarray(value).tobytes()
+        elif isinstance(value, (list, tuple)):
+            yield from map(self.digest, value)
+        elif isinstance(value, (set, frozenset)):
+            yield from sorted(map(self.digest, value))
+        elif isinstance(value, dict):
+            yield from sorted(self.digest(k) + self.digest(v) for k, v in value.items())
+        elif isinstance(value, MethodType):
+            yield self.digest(value.__func__)
+            yield self.digest(value.__self__)
+        elif isinstance(value, FunctionType):
+            yield from self.function_parts(value)
+        elif isinstance(value, BuiltinFunctionType):
+            yield value.__qualname__.encode()
+        elif isinstance(value, Mobject) or hasattr(value, "submobjects"):
+            yield from self.attribute_parts(value, private=False)
+            # Merkle: the children only contribute their own hashes
+            yield from map(self.digest, value.submobjects)
+        elif hasattr(value, "__dict__"):
+            yield from self.attribute_parts(value, private=True)
+
+    def attribute_parts(self, value: Any, private: bool) -> Iterable[bytes]:
+        for name, attribute in sorted(vars(value).items()):
+            if name in SKIPPED_ATTRIBUTES or (not private and name.startswith("_")):
+                continue
+            yield name.encode() + self.digest(attribute)
+
+    def function_parts(self, function: FunctionType) -> Iterable[bytes]:
+        yield function.__qualname__.encode()
+        yield self.code_digest(function.__code__)
+        yield self.digest(function.__defaults__)
+        for cell in function.__closure__ or ():
+            try:
+                yield self.digest(cell.cell_contents)
+            except ValueError:  # empty cell
+                yield b"empty"
+        # globals it reads, like manim does through getclosurevars
+        for name in function.__code__.co_names:
+            if name in function.__globals__:
+                yield name.encode() + self.digest(function.__globals__[name])
+
+    def code_digest(self, code: CodeType) -> bytes:
+        if code not in self._code:
+            h = hashlib.blake2b(code.co_code, digest_size=16)
+            for const in code.co_consts:
+                if isinstance(const, CodeType):
+                    h.update(self.code_digest(const))
+                elif isinstance(const, frozenset):
+                    # `x in {"a", "b"}` compiles to a frozenset, whose order changes between runs
+                    h.update(repr(sorted(map(repr, const))).encode())
+                else:
+                    h.update(repr(const).encode())
+            h.update(repr(code.co_names).encode())
+            self._code[code] = h.digest()
+        return self._code[code]
+
+    def combined(self, values: Iterable[Any]) -> str:
+        h = hashlib.blake2b(digest_size=8)
+        for value in values:
+            h.update(self.digest(value))
+        return h.hexdigest()
+
+    def get_hash_from_play_call(
+            self,
+            scene_object: Scene,
+            camera_object,
+            animations_list: Iterable[Animation],
+            current_mobjects_list: Iterable[Mobject],
+    ) -> str:
+        start = time.perf_counter()
+        try:
+            # same three parts as manim, in the same order
+            self.hashes.append("_".join([
+                self.combined([camera_object]),
+                self.combined(sorted(animations_list, key=str)),
+                self.combined(current_mobjects_list),
+            ]))
+            return self.hashes[-1]
+        finally:
+            self._memo.clear()
+            self._alive.clear()
+            self.calls += 1
+            self.seconds += time.perf_counter() - start
+
+    def install(self) -> None:
+        if self._installed:
+            return
+        self._installed = True
+
+        from manim.renderer import cairo_renderer
+        from manim.utils import caching
+
+        # imported by name where it is used
+        for module in (hashing, cairo_renderer, caching):
+            module.get_hash_from_play_call = self.get_hash_from_play_call
+
+        interpolate_submobject = DrawBorderThenFill.interpolate_submobject
+
+        def aligned_interpolate_submobject(animation: DrawBorderThenFill, submobject, starting, outline, alpha):
+            # the second half interpolates from the outline, which needs the same number of points
+            if alpha >= 0.5 and len(submobject.points) != len(outline.points):
+                submobject.pointwise_become_partial(outline, 0, 1)
+            return interpolate_submobject(animation, submobject, starting, outline, alpha)
+
+        DrawBorderThenFill.interpolate_submobject = aligned_interpolate_submobject
+        atexit.register(self.report)
+
+    def report(self) -> None:
+        if self.calls:
+            logger.info(
+                f"Scene hashing: {self.calls} play calls in {self.seconds:.2f}s, "
+                f"{self.objects / self.calls:.0f} objects per call"
+            )
+
+
+scene_hasher = SceneHasher()
+
+
+def play_hashes(file: str, scene_name: str, quality: str | None, renderer: str | None) -> List[str]:
+    """The hash of every ``play`` of the scene, which is rendered without writing anything."""
+    from common.render import render_scene
+    # run with -m, this module is __main__ and not the one common.render installs
+    from common.scene_hash import scene_hasher as installed
+
+    render_scene(
+        file,
+        scene_name,
+        quality,
+        renderer,
+        disable_caching=False,
+        write_to_movie=False,
+        save_last_frame=False,
+        preview=False
+    )
+    return installed.hashes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", default=None, help="l, m, h, p or k")
+    parser.add_argument("--renderer", default=None)
+    parser.add_argument("--check", action="store_true", help="compare the hashes of two processes")
+    parser.add_argument("--output", default=None, help="write the hashes there as JSON")
+    args = parser.parse_args()
+
+    if not args.check:
+        hashes = json.dumps(play_hashes(args.file, args.scene, args.quality, args.renderer))
+        if args.output is None:
+            print(hashes)
+        else:
+            Path(args.output).write_text(hashes, encoding="utf-8")
+        return
+
+    command = [sys.executable, "-m", "common.scene_hash", args.file, args.scene]
+    if args.quality is not None:
+        command += ["-q", args.quality]
+    if args.renderer is not None:
+        command += ["--renderer", args.renderer]
+    runs = []
+    with tempfile.TemporaryDirectory() as directory:
+        for i in range(2):
+            output = Path(directory) / f"{i}.json"
+            subprocess.run([*command, "--output", str(output)], check=True)
+            runs.append(json.loads(output.read_text(encoding="utf-8")))
+    different = [i for i, (first, second) in enumerate(zip(*runs)) if first != second]
+    if len(runs[0]) != len(runs[1]) or different:
+        print(f"{args.scene}: play hashes differ between processes at animations {different}", file=sys.stderr)
+        sys.exit(1)
+    print(f"{args.scene}: {len(runs[0])} play hashes, the same in both processes")
+
+
+if __name__ == "__main__":
+    main()
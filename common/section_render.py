@@ -0,0 +1,132 @@
+"""Render the sections of one scene in parallel and stitch them together.
+
+The scene marks its cuts with ``self.next_section(...)``. A first pass runs
+``construct`` with every animation skipped to find how many ``play`` calls each
+section owns. Each worker then replays the scene with the animations before its
+section skipped (which rebuilds the scene state at the section boundary without
+rasterizing anything), renders its own range of animations, and the partial
+movies are concatenated with ffmpeg.
+
+    python -m common.section_render LLM/01transformer.py DecoderOnly -q h -j 4
+"""
+from __future__ import annotations
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import List, NamedTuple
+
+from manim import Scene, config, logger, tempconfig
+
+from common.render import concat_movies, load_scene, render_scene
+
+
+class Section(NamedTuple):
+    name: str
+    start: int
+    end: int
+
+
+def find_sections(file: str | Path, scene_name: str) -> List[Section]:
+    boundaries = [("start", 0)]
+    next_section = Scene.next_section
+
+    def record_section(self: Scene, name: str = "unnamed", *args, **kwargs):
+        boundaries.append((name, self.renderer.num_plays))
+        return next_section(self, name, *args, **kwargs)
+
+    Scene.next_section = record_section
+    try:
+        with tempconfig({"input_file": str(file), "dry_run": True}):
+            scene = load_scene(file, scene_name)(skip_animations=True)
+            scene.render()
+            total = scene.renderer.num_plays
+    finally:
+        Scene.next_section = next_section
+
+    sections = []
+    for (name, start), (_, end) in zip(boundaries, boundaries[1:] + [("end", total)]):
+        if end <= start:
+            continue
+        # upto_animation_number == 0 means "no limit" to manim, so a section made of
+        # only the first animation is rendered together with the one after it
+        if sections and sections[-1].end <= 1:
+            sections[-1] = Section(sections[-1].name, sections[-1].start, end)
+        else:
+            sections.append(Section(name, start, end))
+
+    return sections
+
+
+def render_section(
+        file: str,
+        scene_name: str,
+        index: int,
+        section: Section,
+        total: int,
+        quality: str | None,
+        renderer: str | None
+) -> Path:
+    return render_scene(
+        file,
+        scene_name,
+        quality=quality,
+        renderer=renderer,
+        output_file=f"{scene_name}_{index:02}_{section.name}",
+        from_animation_number=section.start,
+        upto_animation_number=section.end - 1 if section.end < total else -1,
+        partial_movie_dir=f"{config.partial_movie_dir}/section_{index:02}",
+        write_to_movie=True,
+        preview=False
+    )
+
+
+def render_sections(
+        file: str | Path,
+        scene_name: str,
+        quality: str | None = None,
+        renderer: str | None = None,
+        jobs: int | None = None
+) -> Path:
+    sections = find_sections(file, scene_name)
+    total = sections[-1].end
+    logger.info(
+        f"{scene_name}: {total} animations in {len(sections)} sections "
+        f"({', '.join(f'{s.name}[{s.start}:{s.end}]' for s in sections)})"
+    )
+
+    # spawned workers, find_sections already set up manim, and an OpenGL context or ffmpeg pipe, in this one
+    with ProcessPoolExecutor(
+            max_workers=jobs or min(len(sections), os.cpu_count() or 1),
+            mp_context=get_context("spawn")
+    ) as pool:
+        futures = [
+            pool.submit(render_section, str(file), scene_name, i, section, total, quality, renderer)
+            for i, section in enumerate(sections)
+        ]
+        movies = [future.result() for future in futures]
+
+    output = movies[0].with_name(f"{scene_name}{config.movie_file_extension}")
+    concat_movies(movies, output)
+    for movie in movies:
+        movie.unlink()
+
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", default=None, help="l, m, h, p or k")
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    parser.add_argument("--renderer", default=None)
+    args = parser.parse_args()
+
+    render_sections(args.file, args.scene, args.quality, args.renderer, args.jobs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Render the frame of a static ``wait()`` once and repeat it to the encoder.
+
+A ``wait`` with no updaters and no time-based mobjects is a frozen frame for
+manim, but every one of its frames still goes through the writer: the cairo
+renderer copies the pixel array and converts it to bytes once per frame, and
+the OpenGL renderer reads the frame buffer back from the GPU once per frame.
+Once installed, the frame is read and converted once and the same buffer is
+sent to ffmpeg for every frame of the wait; with ``common.frame_writer``
+installed it takes a single slot of the ring.
+
+    from common.static_frames import static_frames
+    static_frames.install()
+"""
+from __future__ import annotations
+
+import atexit
+
+import numpy as np
+from manim import logger
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import is_png_format, write_to_movie
+
+
+class StaticFrames:
+    def __init__(self):
+        self.segments = 0
+        # frames written without rendering or reading them back
+        self.repeated = 0
+        self._installed = False
+
+    def write_repeated(self, writer: SceneFileWriter, frame: np.ndarray, count: int) -> None:
+        self.segments += 1
+        self.repeated += count - 1
+        ring = getattr(writer, "frame_ring", None)
+        if ring is not None:
+            ring.put(frame, count)
+            return
+
+        data = np.ascontiguousarray(frame).data
+        for _ in range(count):
+            writer.writing_process.stdin.write(data)
+
+    def install(self) -> None:
+        if self._installed:
+            return
+        self._installed = True
+
+        add_frame = CairoRenderer.add_frame
+        write_opengl_frame = SceneFileWriter.write_opengl_frame
+
+        def repeating_add_frame(renderer: CairoRenderer, frame: np.ndarray, num_frames: int = 1):
+            # png output needs one file per frame
+            if num_frames == 1 or renderer.skip_animations or not write_to_movie() or is_png_format():
+                return add_frame(renderer, frame, num_frames)
+            renderer.time += num_frames * (1 / renderer.camera.frame_rate)
+            self.write_repeated(renderer.file_writer, frame, num_frames)
+
+        def freeze_current_frame(renderer: CairoRenderer, duration: float):
+            # the frame is copied by whatever writes it, get_frame's copy is not needed
+            dt = 1 / renderer.camera.frame_rate
+            renderer.add_frame(renderer.camera.pixel_array, num_frames=int(duration / dt))
+
+        def static_write_opengl_frame(writer: SceneFileWriter, renderer):
+            scene = getattr(renderer, "scene", None)
+            if (
+                    not write_to_movie()
+                    or scene is None
+                    or not scene.animations
+                    or not scene.is_current_animation_frozen_frame()
+            ):
+                return write_opengl_frame(writer, renderer)
+
+            # OpenGLRenderer.play writes the frozen frame once per frame of the wait
+            if writer.__dict__.get("static_play") != renderer.num_plays:
+                writer.static_play = renderer.num_plays
+                writer.static_frame = np.frombuffer(renderer.get_raw_frame_buffer_object_data(), dtype=np.uint8)
+                self.segments += 1
+            else:
+                self.repeated += 1
+
+            ring = getattr(writer, "frame_ring", None)
+            if ring is not None:
+                ring.put(writer.static_frame)
+            else:
+                writer.writing_process.stdin.write(writer.static_frame.data)
+
+        CairoRenderer.add_frame = repeating_add_frame
+        CairoRenderer.freeze_current_frame = freeze_current_frame
+        SceneFileWriter.write_opengl_frame = static_write_opengl_frame
+        atexit.register(self.report)
+
+    def report(self) -> None:
+        if self.segments:
+            logger.info(f"Static frames: {self.repeated} frames of {self.segments} waits repeated without rendering")
+
+
+static_frames = StaticFrames()
@@ -0,0 +1,115 @@
+"""Persistent cache of compiled Tex/MathTex outlines shared by every scene module.
+
+Entries are keyed by a hash of the full LaTeX source (template, environment and
+expression) and hold the parsed path data of each glyph, so a hit skips LaTeX,
+dvisvgm and SVG parsing altogether.
+
+    from common.tex_cache import tex_cache
+    tex_cache.install()
+"""
+from __future__ import annotations
+
+import atexit
+import hashlib
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+from manim import VMobject, config
+from manim.mobject.text import tex_mobject
+from manim.mobject.text.tex_mobject import SingleStringMathTex
+from manim.utils.tex import TexTemplate
+
+from common.cache import CACHE_DIR, DiskCache
+
+
+class TexCache(DiskCache):
+    def __init__(self, directory: Path = CACHE_DIR / "tex", max_bytes: int = 64 * 2 ** 20):
+        super().__init__(directory, max_bytes)
+        self._sources: Dict[str, Tuple[str, str | None, TexTemplate]] = {}
+        self._installed = False
+
+    @staticmethod
+    def key(expression: str, environment: str | None, tex_template: TexTemplate) -> str:
+        if environment is not None:
+            tex_code = tex_template.get_texcode_for_expression_in_env(expression, environment)
+        else:
+            tex_code = tex_template.get_texcode_for_expression(expression)
+
+        source = "\n".join([tex_code, tex_template.tex_compiler, tex_template.output_format, str(config.renderer)])
+        return hashlib.sha256(source.encode()).hexdigest()[:32]
+
+    @staticmethod
+    def to_arrays(mobjects: List[VMobject]) -> Dict[str, np.ndarray]:
+        arrays = {f"points_{i}": mob.points for i, mob in enumerate(mobjects)}
+        arrays["fill_color"] = np.array([mob.get_fill_color().to_hex() for mob in mobjects])
+        arrays["fill_opacity"] = np.array([mob.get_fill_opacity() for mob in mobjects], dtype=float)
+        arrays["stroke_color"] = np.array([mob.get_stroke_color().to_hex() for mob in mobjects])
+        arrays["stroke_opacity"] = np.array([mob.get_stroke_opacity() for mob in mobjects], dtype=float)
+        arrays["stroke_width"] = np.array([mob.get_stroke_width() for mob in mobjects], dtype=float)
+        return arrays
+
+    @staticmethod
+    def to_mobjects(arrays: Dict[str, np.ndarray]) -> List[VMobject]:
+        mobjects = []
+        for i in range(len(arrays["fill_color"])):
+            mob = VMobject()
+            mob.set_points(arrays[f"points_{i}"])
+            mob.set_style(
+                fill_color=str(arrays["fill_color"][i]),
+                fill_opacity=float(arrays["fill_opacity"][i]),
+                stroke_color=str(arrays["stroke_color"][i]),
+                stroke_opacity=float(arrays["stroke_opacity"][i]),
+                stroke_width=float(arrays["stroke_width"][i]),
+            )
+            mobjects.append(mob)
+        return mobjects
+
+    def install(self) -> None:
+        if self._installed:
+            return
+        self._installed = True
+
+        tex_to_svg_file = tex_mobject.tex_to_svg_file
+        generate_mobject = SingleStringMathTex.generate_mobject
+
+        def cached_tex_to_svg_file(expression, environment=None, tex_template=None):
+            if tex_template is None:
+                tex_template = config["tex_template"]
+            key = self.key(expression, environment, tex_template)
+            self._sources[key] = (expression, environment, tex_template)
+            # the returned file only has to exist when the outlines are not cached yet;
+            # its name is what SingleStringMathTex.generate_mobject looks up below
+            return self.directory / f"{key}.svg"
+
+        def cached_generate_mobject(mob: SingleStringMathTex):
+            svg_file = mob.file_name
+            if svg_file is None or svg_file.parent != self.directory:
+                return generate_mobject(mob)
+
+            key = svg_file.stem
+            arrays = self.get(key)
+            if arrays is not None:
+                mob.add(*self.to_mobjects(arrays))
+                return
+
+            # a name of its own, other processes sharing the cache may be reading the same key
+            mob.file_name = svg_file.with_name(f"{key}.{os.getpid()}.svg")
+            shutil.copyfile(tex_to_svg_file(*self._sources[key]), mob.file_name)
+            try:
+                generate_mobject(mob)
+            finally:
+                mob.file_name.unlink()
+                mob.file_name = svg_file
+            self.put(key, self.to_arrays(mob.submobjects))
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tex_mobject.tex_to_svg_file = cached_tex_to_svg_file
+        SingleStringMathTex.generate_mobject = cached_generate_mobject
+        atexit.register(self.save_index)
+        atexit.register(self.report, "Tex")
+
+
+tex_cache = TexCache()
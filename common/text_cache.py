@@ -0,0 +1,100 @@
+"""Layout cache for ``Text``: Pango runs and the SVG is parsed once per layout.
+
+A layout is everything that shapes the glyphs (string, font, size, slant,
+weight, t2f/t2s/t2w, ...). ``color`` and ``t2c`` only restyle the glyphs, so a
+recoloured copy of an already built ``Text`` is handed out instead of building
+it again. ``t2w`` stays part of the key because a weight change produces
+different outlines.
+
+    from common.text_cache import text_cache
+    text_cache.install()
+"""
+from __future__ import annotations
+
+import atexit
+import inspect
+from collections import OrderedDict
+from typing import Dict
+
+from manim import ManimColor, Text, logger
+
+
+class TextCache:
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._texts: OrderedDict[str, Text] = OrderedDict()
+        self._installed = False
+
+    @staticmethod
+    def key(text: str, kwargs: dict) -> str:
+        return repr((text, sorted(kwargs.items())))
+
+    def get(self, text: str, kwargs: dict, build) -> Text:
+        key = self.key(text, kwargs)
+        if key in self._texts:
+            self._texts.move_to_end(key)
+            self.hits += 1
+        else:
+            self._texts[key] = build()
+            self.misses += 1
+            if len(self._texts) > self.max_entries:
+                self._texts.popitem(last=False)
+        return self._texts[key].copy()
+
+    @staticmethod
+    def restyle(mob: Text, color, t2c: Dict[str, str]) -> None:
+        if color is not None:
+            mob.set_color(color)
+        mob.t2c = {word: ManimColor(c).to_hex() for word, c in t2c.items()}
+        for word, c in mob.t2c.items():
+            for start, end in mob._find_indexes(word, mob.text):
+                mob.chars[start:end].set_color(c)
+
+    def install(self) -> None:
+        if self._installed:
+            return
+        self._installed = True
+
+        text_init = Text.__init__
+        signature = inspect.signature(text_init)
+
+        def cached_init(mob: Text, *args, **kwargs):
+            # Text's own signature, positional arguments included; only what the caller passed
+            arguments = signature.bind(mob, *args, **kwargs).arguments
+            del arguments["self"]
+            arguments.update(arguments.pop("kwargs", {}))
+            text = arguments.pop("text")
+            color = arguments.pop("color", None)
+            t2c = arguments.pop("text2color", arguments.pop("t2c", None)) or {}
+            if (
+                    type(mob) is not Text
+                    or any(k in arguments for k in ("gradient", "t2g", "text2gradient"))
+                    or any(char.isspace() for word in t2c for char in word)
+            ):
+                return text_init(mob, *args, **kwargs)
+
+            def build():
+                base = Text.__new__(Text)
+                text_init(base, text, **arguments)
+                return base
+
+            cached = self.get(text, arguments, build)
+            mob.__dict__.update(cached.__dict__)
+            for submob in mob.submobjects:
+                # OpenGL mobjects keep a back reference to their parents
+                if hasattr(submob, "parents"):
+                    submob.parents = [mob if parent is cached else parent for parent in submob.parents]
+            self.restyle(mob, color, t2c)
+
+        Text.__init__ = cached_init
+        atexit.register(self.report)
+
+    def report(self) -> None:
+        total = self.hits + self.misses
+        if total:
+            logger.info(f"Text cache: {self.hits} hits, {self.misses} misses ({self.hits / total:.0%})")
+
+
+text_cache = TextCache()
@@ -0,0 +1,177 @@
+"""Time every updater, ``become`` call and ``always_redraw`` rebuild of a render.
+
+Timings are aggregated by mobject class and by the source location of the
+updater (``always_redraw`` updaters are named after the function they
+redraw), reported per frame when the process exits, and written as folded
+stacks that ``flamegraph.pl`` or speedscope read directly.
+
+    python -m common.updater_profile demo/02animate.py MovingAngle -q l
+
+or, from a scene module:
+
+    from common.updater_profile import updater_profiler
+    updater_profiler.install()
+"""
+from __future__ import annotations
+
+import argparse
+import atexit
+import functools
+import inspect
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, List
+
+from manim import Mobject, Scene, logger
+
+from common.render import ROOT, render_scene
+
+
+class UpdaterProfiler:
+    def __init__(self, output: Path = ROOT / "media" / "updaters.folded"):
+        self.output = output
+        self.frames = 0
+        # exclusive seconds and number of calls per folded stack
+        self.times: Counter[str] = Counter()
+        self.calls: Counter[str] = Counter()
+        self._stack: List[str] = []
+        self._children: List[float] = []
+        self._installed = False
+
+    @contextmanager
+    def measure(self, name: str):
+        self._stack.append(name)
+        self._children.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stack = ";".join(self._stack)
+            self.times[stack] += elapsed - self._children.pop()
+            self.calls[stack] += 1
+            self._stack.pop()
+            if self._children:
+                self._children[-1] += elapsed
+
+    @staticmethod
+    def location(function: Callable) -> str:
+        code = function.__code__
+        file = Path(code.co_filename)
+        try:
+            file = file.relative_to(ROOT)
+        except ValueError:
+            file = Path(file.name)
+        return f"{file.as_posix()}:{code.co_firstlineno}"
+
+    @classmethod
+    def label(cls, function: Callable) -> str:
+        if not hasattr(function, "__code__"):
+            return repr(function)
+        # always_redraw adds `lambda m: mob.become(func())`, name it after func
+        if "manim" in Path(function.__code__.co_filename).parts and function.__closure__:
+            redrawn = inspect.getclosurevars(function).nonlocals.get("func")
+            if callable(redrawn):
+                return f"always_redraw({cls.label(redrawn)})"
+        return f"{function.__qualname__} ({cls.location(function)})"
+
+    def install(self) -> None:
+        if self._installed:
+            return
+        self._installed = True
+
+        mobject_classes = [Mobject]
+        try:
+            from manim.mobject.opengl.opengl_mobject import OpenGLMobject
+            mobject_classes.append(OpenGLMobject)
+        except ImportError:
+            pass
+
+        for cls in mobject_classes:
+            self._patch_mobject(cls)
+
+        update_mobjects = Scene.update_mobjects
+
+        def timed_update_mobjects(scene: Scene, dt: float):
+            self.frames += 1
+            with self.measure("frame"):
+                return update_mobjects(scene, dt)
+
+        Scene.update_mobjects = timed_update_mobjects
+        atexit.register(self.report)
+
+    def _patch_mobject(self, cls) -> None:
+        add_updater = cls.add_updater
+        remove_updater = cls.remove_updater
+        become = cls.become
+
+        def timed_add_updater(mob, update_function, *args, **kwargs):
+            name = f"{type(mob).__name__};{self.label(update_function)}"
+
+            # wraps keeps the signature, which manim inspects for a dt parameter
+            @functools.wraps(update_function)
+            def timed(*updater_args, **updater_kwargs):
+                with self.measure(name):
+                    return update_function(*updater_args, **updater_kwargs)
+
+            return add_updater(mob, timed, *args, **kwargs)
+
+        def unwrapping_remove_updater(mob, update_function):
+            for updater in list(mob.updaters):
+                if getattr(updater, "__wrapped__", None) is update_function:
+                    remove_updater(mob, updater)
+            return remove_updater(mob, update_function)
+
+        def timed_become(mob, *args, **kwargs):
+            with self.measure("become" if self._stack else f"{type(mob).__name__};become"):
+                return become(mob, *args, **kwargs)
+
+        cls.add_updater = timed_add_updater
+        cls.remove_updater = unwrapping_remove_updater
+        cls.become = timed_become
+
+    def report(self) -> None:
+        if not self.times:
+            return
+
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        with self.output.open("w", encoding="utf-8") as fp:
+            for stack, seconds in sorted(self.times.items()):
+                # folded stacks count samples, use microseconds
+                fp.write(f"{stack.replace(' ', '_')} {round(seconds * 1e6)}\n")
+
+        inclusive = Counter()
+        for stack, seconds in self.times.items():
+            frames = stack.split(";")
+            for depth in range(1, len(frames) + 1):
+                inclusive[";".join(frames[:depth])] += seconds
+
+        frames = max(self.frames, 1)
+        logger.info(f"Updaters over {self.frames} frames, folded stacks in {self.output}")
+        measured = [(stack, seconds) for stack, seconds in inclusive.most_common() if stack in self.calls]
+        for stack, seconds in measured[:20]:
+            logger.info(f"{seconds * 1e3 / frames:8.3f} ms/frame {self.calls[stack]:7} calls  {stack}")
+
+
+updater_profiler = UpdaterProfiler()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", default="l", help="l, m, h, p or k")
+    parser.add_argument("--renderer", default=None)
+    parser.add_argument("-o", "--output", type=Path, default=None, help="folded stacks file")
+    args = parser.parse_args()
+
+    if args.output is not None:
+        updater_profiler.output = args.output
+    updater_profiler.install()
+    render_scene(args.file, args.scene, args.quality, args.renderer, disable_caching=True, preview=False)
+
+
+if __name__ == "__main__":
+    main()
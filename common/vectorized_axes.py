@@ -0,0 +1,116 @@
+"""``Axes`` that sample plotted functions with one call per batch of x values.
+
+``Axes.plot`` calls the function, and ``coords_to_point``, once per sample,
+and ``get_area`` converts every point of the graph back to coordinates one at
+a time. ``VectorizedAxes.plot`` passes the whole array of x values to the
+function instead, falling back to one call per value when the function only
+takes scalars. After the first pass, samples are added only between the ones
+where the graph turns by more than ``max_angle`` on screen.
+
+    from common.vectorized_axes import VectorizedAxes
+    ax = VectorizedAxes(x_range=[0, 10], y_range=[0, 10])
+    graph = ax.plot(lambda x: 25 / x, x_range=[2.5, 10.0, 0.01])
+"""
+from __future__ import annotations
+
+from typing import Callable, Sequence
+
+import numpy as np
+from manim import BLUE, GREEN, PI, Axes, ParametricFunction, Polygon
+
+
+def sample(function: Callable, xs: np.ndarray) -> np.ndarray:
+    """``function`` at every x, in one call if the function accepts arrays."""
+    try:
+        with np.errstate(all="ignore"):
+            ys = np.asarray(function(xs), dtype=float)
+        if ys.shape == xs.shape:
+            return ys
+    except (TypeError, ValueError):
+        pass
+    return np.array([function(x) for x in xs], dtype=float)
+
+
+class VectorizedAxes(Axes):
+    def _graph_points(self, function: Callable, ts: np.ndarray) -> np.ndarray:
+        xs = self.x_axis.scaling.function(ts)
+        return self.coords_to_point(xs, sample(function, xs)).T
+
+    def plot(
+            self,
+            function: Callable[[float], float],
+            x_range: Sequence[float] | None = None,
+            use_vectorized: bool = True,
+            max_angle: float = PI / 36,
+            max_refinements: int = 3,
+            **kwargs,
+    ) -> ParametricFunction:
+        if not use_vectorized or kwargs.get("discontinuities") is not None:
+            return super().plot(function, x_range=x_range, **kwargs)
+
+        # same sampling as Axes.plot
+        t_min, t_max, t_step = np.array(self.x_range, dtype=float)
+        if x_range is not None:
+            t_min, t_max, t_step = [*x_range, t_step][:3]
+        if x_range is None or len(x_range) < 3:
+            t_step /= self.num_sampled_graph_points_per_tick
+
+        ts = np.append(np.arange(t_min, t_max, t_step, dtype=float), t_max)
+        points = self._graph_points(function, ts)
+        for _ in range(max_refinements):
+            segments = np.diff(points, axis=0)
+            lengths = np.linalg.norm(segments, axis=1)
+            products = np.maximum(lengths[:-1] * lengths[1:], 1e-12)
+            cosines = np.einsum("ij,ij->i", segments[:-1], segments[1:]) / products
+            bends = np.flatnonzero(cosines < np.cos(max_angle))
+            if not len(bends):
+                break
+
+            # split both intervals meeting at a sharp bend
+            split = np.zeros(len(ts) - 1, dtype=bool)
+            split[bends] = split[bends + 1] = True
+            where = np.flatnonzero(split)
+            mids = (ts[where] + ts[where + 1]) / 2
+            ts = np.insert(ts, where + 1, mids)
+            points = np.insert(points, where + 1, self._graph_points(function, mids), axis=0)
+
+        # built from its two end points only, the samples above replace them
+        graph = super().plot(function, x_range=[t_min, t_max, t_max - t_min], **kwargs)
+        graph.clear_points()
+        graph.start_new_path(points[0])
+        graph.add_points_as_corners(points[1:])
+        if graph.use_smoothing:
+            graph.make_smooth()
+        graph.t_step = t_step
+        return graph
+
+    def get_area(
+            self,
+            graph: ParametricFunction,
+            x_range: tuple[float, float] | None = None,
+            color=(BLUE, GREEN),
+            opacity: float = 0.3,
+            bounded_graph: ParametricFunction = None,
+            **kwargs,
+    ) -> Polygon:
+        a, b = (graph.t_min, graph.t_max) if x_range is None else x_range
+        if bounded_graph is not None:
+            if bounded_graph.t_min > b:
+                raise ValueError(f"Ranges not matching: {bounded_graph.t_min} < {b}")
+            if bounded_graph.t_max < a:
+                raise ValueError(f"Ranges not matching: {bounded_graph.t_max} > {a}")
+            a = max(a, bounded_graph.t_min)
+            b = min(b, bounded_graph.t_max)
+
+        def points_between(g: ParametricFunction) -> np.ndarray:
+            xs = self.x_axis.point_to_number(g.points)
+            return g.points[(a <= xs) & (xs <= b)]
+
+        if bounded_graph is None:
+            points = [[self.c2p(a), graph.function(a)], points_between(graph), [graph.function(b), self.c2p(b)]]
+        else:
+            points = [
+                [graph.function(a)], points_between(graph), [graph.function(b)],
+                [bounded_graph.function(b)], points_between(bounded_graph)[::-1], [bounded_graph.function(a)],
+            ]
+        return Polygon(*np.concatenate(points), **kwargs).set_opacity(opacity).set_color(color)
@@ -0,0 +1,72 @@
+"""The faces of a ``Surface``, with its function evaluated over the whole (u, v) grid at once.
+
+``Surface`` maps every point of every face through ``func(u, v)`` one at a
+time, and ``always_redraw`` rebuilds the faces and their checkerboard on every
+frame. ``VectorizedSurface`` builds the faces once, keeps the (u, v)
+coordinates of all their points in one array and re-evaluates ``func`` on it
+in a single NumPy call; ``update_surface`` then writes the new points into the
+existing faces, so topology and colouring are reused. The faces are those of
+a manim ``Surface``, under either renderer.
+
+``func`` receives arrays of u and v and returns ``np.array([x, y, z])`` of
+arrays, written with NumPy operations like the scalar version:
+
+    from common.vectorized_surface import VectorizedSurface
+    surface = VectorizedSurface(lambda u, v: np.array([u, v, np.sin(u * v)]), u_range=[-2, 2], v_range=[-2, 2])
+    surface.add_updater(lambda s: s.update_surface())
+"""
+from __future__ import annotations
+
+import numpy as np
+from manim import Surface, VGroup
+
+
+class VectorizedSurface(VGroup):
+    def __init__(self, func, **kwargs):
+        super().__init__()
+        # the faces of a Surface laid out in (u, v) space. Subclassing Surface would make
+        # ConvertToOpenGL swap it for OpenGLSurface under the OpenGL renderer, which has no faces
+        uv_surface = Surface(lambda u, v: np.array([u, v, 0.0]), **kwargs)
+        self.add(*uv_surface.submobjects)
+        self.u_range = uv_surface.u_range
+        self.v_range = uv_surface.v_range
+        self.resolution = uv_surface.resolution
+        self.checkerboard_colors = uv_surface.checkerboard_colors
+        self.should_make_jagged = uv_surface.should_make_jagged
+        self._func = func
+        self._uv = np.concatenate([face.points[:, :2] for face in self])
+
+        # a cubic Surface maps its handles pulled close to their anchors and pushes them
+        # back out afterwards, so the tangents follow the function
+        self._anchors = np.arange(len(self._uv))
+        self._handle_factor = 1.0
+        n = self.n_points_per_curve
+        if hasattr(self, "scale_handle_to_anchor_distances") and n == 4:
+            self._anchors = self._anchors // n * n + np.tile([0, 0, 3, 3], len(self._uv) // n)
+            self._handle_factor = uv_surface.pre_function_handle_to_anchor_scale_factor
+
+        self.update_surface()
+
+    set_fill_by_checkerboard = Surface.set_fill_by_checkerboard
+    set_fill_by_value = Surface.set_fill_by_value
+
+    def func(self, u, v) -> np.ndarray:
+        return self._func(u, v)
+
+    def evaluate(self) -> np.ndarray:
+        """Points of all faces for the current state of ``func``."""
+        anchors = self._uv[self._anchors]
+        uv = anchors + self._handle_factor * (self._uv - anchors)
+
+        points = np.stack(np.broadcast_arrays(*self._func(uv[:, 0], uv[:, 1])), axis=-1).astype(float)
+        return points[self._anchors] + (points - points[self._anchors]) / self._handle_factor
+
+    def update_surface(self) -> VectorizedSurface:
+        """Re-evaluate ``func`` and move the points of the existing faces; transforms applied since are lost."""
+        points = self.evaluate()
+        size = len(points) // len(self.submobjects)
+        for face, face_points in zip(self.submobjects, points.reshape(-1, size, 3)):
+            face.set_points(face_points)
+        if self.should_make_jagged:
+            self.make_jagged()
+        return self
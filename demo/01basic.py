@@ -1,6 +1,15 @@
+import sys
+from pathlib import Path
+
 from manim import *
 import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.tex_cache import tex_cache
+
+tex_cache.install()
+
 
 class ManimCELogo(Scene):
     def construct(self):
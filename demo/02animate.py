@@ -1,6 +1,19 @@
+import sys
+from pathlib import Path
+
 from manim import *
 import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.arc_length import arc_length_cache
+from common.fast_geometry import FastAngle, FastLine
+from common.growing_path import GrowingPath
+from common.tex_cache import tex_cache
+
+arc_length_cache.install()
+tex_cache.install()
+
 
 class BooleanOperations(Scene):
     def construct(self):
@@ -65,30 +78,29 @@ class MovingAngle(Scene):
 
         theta_tracker = ValueTracker(110)
         line1 = Line(LEFT, RIGHT)
-        line_moving = Line(LEFT, RIGHT)
-        line_ref = line_moving.copy()
+        line_moving = FastLine(LEFT, RIGHT)
 
-        line_moving.rotate(
+        line_moving.set_angle(
             theta_tracker.get_value() * DEGREES, about_point=rotation_center
         )
 
-        a = Angle(line1, line_moving, radius=0.5, other_angle=False)
+        a = FastAngle(line1, line_moving, radius=0.5, other_angle=False)
 
         tex = MathTex(r'\theta').move_to(
-            Angle(line1, line_moving, radius=0.5 + 3 * SMALL_BUFF, other_angle=False).point_from_proportion(0.5)
+            a.arc_midpoint(0.5 + 3 * SMALL_BUFF)
         )
 
         self.add(line1, line_moving, a, tex)
         self.wait()
 
-        line_moving.add_updater(lambda x: x.become(line_ref.copy()).rotate(
+        line_moving.add_updater(lambda x: x.set_angle(
             theta_tracker.get_value() * DEGREES, about_point=rotation_center
         ))
 
-        a.add_updater(lambda x: x.become(Angle(line1, line_moving, radius=0.5, other_angle=False)))
+        a.add_updater(lambda x: x.match_lines())
 
         tex.add_updater(lambda x: x.move_to(
-            Angle(line1, line_moving, radius=0.5 + 3 * SMALL_BUFF, other_angle=False).point_from_proportion(0.5)
+            a.arc_midpoint(0.5 + 3 * SMALL_BUFF)
         ))
 
         self.play(theta_tracker.animate.set_value(40))
@@ -101,7 +113,7 @@ class MovingDots(Scene):
     def construct(self):
         d1, d2 = Dot(color=BLUE), Dot(color=GREEN)
         dg = VGroup(d1, d2).arrange(RIGHT, buff=1)
-        l1 = Line(d1.get_center(), d2.get_center()).set_color(RED)
+        l1 = FastLine(d1.get_center(), d2.get_center()).set_color(RED)
 
         self.add(dg, l1)
 
@@ -110,9 +122,7 @@ class MovingDots(Scene):
 
         d1.add_updater(lambda z: z.set_x(x.get_value()))
         d2.add_updater(lambda z: z.set_y(y.get_value()))
-        l1.add_updater(lambda z: z.become(
-            Line(d1.get_center(), d2.get_center())
-        ))
+        l1.add_updater(lambda z: z.set_points_from(d1.get_center(), d2.get_center()))
 
         self.play(x.animate.set_value(5))
         self.play(y.animate.set_value(4))
@@ -173,14 +183,11 @@ class RotationUpdater(Scene):
 
 class PointWithTrace(Scene):
     def construct(self):
-        path = VMobject()
         dot = Dot()
-        path.set_points_as_corners(np.array([dot.get_center(), dot.get_center()]))
+        path = GrowingPath(dot.get_center())
 
-        def update_path(path: Mobject):
-            pre_path = path.copy()
-            pre_path.add_points_as_corners(np.array([dot.get_center()]))
-            path.become(pre_path)
+        def update_path(path: GrowingPath):
+            path.append(dot.get_center())
 
         path.add_updater(update_path)
         self.add(path, dot)
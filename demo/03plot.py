@@ -1,12 +1,21 @@
+import sys
+from pathlib import Path
 from typing import Tuple
 
 from manim import *
 import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.tex_cache import tex_cache
+from common.vectorized_axes import VectorizedAxes
+
+tex_cache.install()
+
 
 class SinAndCosFunctionPlot(Scene):
     def construct(self):
-        axes = Axes(
+        axes = VectorizedAxes(
             x_range=[-10, 10.3, 1],
             y_range=[-1.5, 1.5, 1],
             x_length=10,
@@ -38,7 +47,7 @@ class SinAndCosFunctionPlot(Scene):
 
 class ArgMinExample(Scene):
     def construct(self):
-        axe = Axes(
+        axe = VectorizedAxes(
             x_range=[0, 10],
             y_range=[0, 100, 10],
             axis_config={"include_tip": False}
@@ -70,7 +79,7 @@ class ArgMinExample(Scene):
 
 class GraphArePlot(Scene):
     def construct(self):
-        ax = Axes(
+        ax = VectorizedAxes(
             x_range=[0, 5],
             y_range=[0, 6],
             x_axis_config={'numbers_to_include': [2, 3]},
@@ -111,7 +120,7 @@ class PolygonOnAxes(Scene):
         ]
 
     def construct(self):
-        ax = Axes(
+        ax = VectorizedAxes(
             x_range=[0, 10],
             y_range=[0, 10],
             x_length=6,
@@ -160,7 +169,7 @@ class PolygonOnAxes(Scene):
 
 class HeatDiagramPlot(Scene):
     def construct(self):
-        ax = Axes(
+        ax = VectorizedAxes(
             x_range=[0, 40, 5],
             y_range=[-8, 32, 5],
             x_length=9,
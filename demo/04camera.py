@@ -1,6 +1,16 @@
+import sys
+from pathlib import Path
+
 from manim import *
 import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.arc_length import arc_length_cache
+from common.vectorized_surface import VectorizedSurface
+
+arc_length_cache.install()
+
 
 class FollowingGraphCamera(MovingCameraScene):
     def construct(self):
@@ -171,33 +181,30 @@ class ThreeDSurfacePlot(ThreeDScene):
             y = v
             sigma_val = sigma.get_value()
 
-            d = np.linalg.norm(np.array([x - mu[0], y - mu[0]]))
+            d = np.linalg.norm(np.array([x - mu[0], y - mu[0]]), axis=0)
             z = np.exp(-(d ** 2 / (2.0 * sigma_val ** 2)))
 
             return np.array([x, y, z])
 
         resolution_fa = 30
 
-        def gauss():
-            gauss_surface = Surface(
-                param_gauss,
-                resolution=(resolution_fa, resolution_fa),
-                v_range=[-2, 2],
-                u_range=[-2, 2]
-            )
+        gauss_surface = VectorizedSurface(
+            param_gauss,
+            resolution=(resolution_fa, resolution_fa),
+            v_range=[-2, 2],
+            u_range=[-2, 2]
+        )
 
-            gauss_surface.scale(2, about_point=ORIGIN)
-            gauss_surface.set_style(fill_opacity=1, stroke_color=GREEN)
-            gauss_surface.set_fill_by_checkerboard(ORANGE, BLUE, opacity=0.8)
+        gauss_surface.scale(2, about_point=ORIGIN)
+        gauss_surface.set_style(fill_opacity=1, stroke_color=GREEN)
+        gauss_surface.set_fill_by_checkerboard(ORANGE, BLUE, opacity=0.8)
 
-            return gauss_surface
+        self.play(Write(gauss_surface))
 
-        init_surface = gauss()
-        self.play(Write(init_surface))
-        self.remove(init_surface)
+        def update_gauss(surface: VectorizedSurface):
+            surface.update_surface().scale(2, about_point=ORIGIN)
 
-        gauss_plane = always_redraw(gauss)
-        self.add(gauss_plane)
+        gauss_surface.add_updater(update_gauss)
 
         self.play(sigma.animate.set_value(1), run_time=2)
         self.wait()
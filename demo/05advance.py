@@ -1,8 +1,19 @@
+import sys
+from pathlib import Path
 from typing import Optional
 
 import numpy as np
 from manim import *
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.arc_length import arc_length_cache
+from common.growing_path import GrowingPath
+from common.tex_cache import tex_cache
+
+arc_length_cache.install()
+tex_cache.install()
+
 
 class OpeningManim(Scene):
     def construct(self):
@@ -51,10 +62,11 @@ class OpeningManim(Scene):
 class SineCurveUnitCircle(Scene):
     def __init__(self, **kwargs):
         Scene.__init__(self, **kwargs)
-        self.curve: VGroup = VGroup()
         self.t_offset: float = 0
         self.origin_point = np.array([-4, 0, 0])
         self.curve_start = np.array([-3, 0, 0])
+        # merge samples that stay within a fraction of a pixel of a straight line
+        self.curve = GrowingPath(self.curve_start, color=YELLOW, tolerance=0.002)
         self.circle: Optional[Mobject] = None
 
     def construct(self):
@@ -119,24 +131,17 @@ class SineCurveUnitCircle(Scene):
 
             return Line(dot.get_center(), np.array([x, y, 0]), color=YELLOW_A, stroke_width=2)
 
-        self.curve.add(Line(self.curve_start, self.curve_start))
-
-        def get_curve():
-            last_line = self.curve[-1]
+        def update_curve(curve: GrowingPath):
             x = self.curve_start[0] + self.t_offset * 4
             y = dot.get_center()[1]
-
-            new_line = Line(last_line.get_end(), np.array([x, y, 0]), color=YELLOW)
-            self.curve.add(new_line)
-
-            return self.curve
+            curve.append(np.array([x, y, 0]))
 
         origin_to_circle_line = always_redraw(get_line_to_circle)
         dot_to_curve_line = always_redraw(get_line_to_curve)
-        sine_curve_line = always_redraw(get_curve)
+        self.curve.add_updater(update_curve)
 
         self.add(dot)
-        self.add(orbit, origin_to_circle_line, dot_to_curve_line, sine_curve_line)
+        self.add(orbit, origin_to_circle_line, dot_to_curve_line, self.curve)
 
         dot.add_updater(go_around_circle)
         self.wait(8.5)